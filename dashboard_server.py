@@ -12,18 +12,44 @@ import os
 import sys
 import json
 import socket
+import subprocess
 import time
 import threading
 import hashlib
 import base64
 import struct
-import shutil
+import stat
+import itertools
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from orchestrator_logger import OrchestratorLogger
 from ptyprocess import PtyProcessUnicode
 from process_manager import ProcessManager
 
+# Directory containing this module, resolved once; static files are served from here
+SERVER_DIR = Path(__file__).parent
+_SERVER_DIR_STR = str(SERVER_DIR)
+
+# Project directory the server was launched from (log files are served from here);
+# the server never changes directory, so it is read once instead of per request
+_PROJECT_DIR = os.getcwd()
+
+
+@lru_cache(maxsize=32)
+def _read_asset(path: str, mtime_ns: int) -> bytes:
+    """Read a static dashboard asset; keyed on mtime so edited files are re-read"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _find_claude_via_login_shell():
+    """Locate claude through a login shell, whose profile may add it to PATH"""
+    try:
+        result = subprocess.run(['bash', '-l', '-c', 'which claude'], 
+                              capture_output=True, text=True, timeout=5)
+    except Exception:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
 # Global ProcessManager instance for terminal process tracking
 _process_manager = None
 
@@ -38,10 +64,25 @@ def get_process_manager():
         _process_manager = ProcessManager(meta_mode=meta_mode)
     return _process_manager
 
+# Shared request logger; building one per request rewrote the log's start banner every time
+_request_logger = None
+
+def get_request_logger():
+    """Get or create the shared dashboard request logger"""
+    global _request_logger
+    if _request_logger is None:
+        _request_logger = OrchestratorLogger("dashboard-requests")
+    return _request_logger
+
 
 class WebSocketTerminalSession:
     """Manages a terminal session over WebSocket connection"""
     
+    # Claude CLI path from the first session's login-shell lookup; shared by later sessions
+    _claude_path = None
+    # Set once the login shell has been asked, so a miss is not looked up again
+    _claude_path_checked = False
+    
     def __init__(self, connection, process_manager=None):
         self.connection = connection
         self.pty_process = None
@@ -49,7 +90,7 @@ class WebSocketTerminalSession:
         self.running = False
         self.process_manager = process_manager or get_process_manager()
         self.process_name = None
-        self.terminal_logger = OrchestratorLogger("terminal-handler")
+        self.terminal_logger = OrchestratorLogger("terminal-handler", keep_open=False)
         
     def start(self):
         """Start terminal session and PTY process"""
@@ -58,7 +99,7 @@ class WebSocketTerminalSession:
         try:
             # Log environment context before spawn attempt
             env_context = {
-                'working_directory': os.getcwd(),
+                'working_directory': _PROJECT_DIR,
                 'path_env': os.environ.get('PATH', 'Not set'),
                 'claude_cli_command': 'claude'
             }
@@ -70,16 +111,19 @@ class WebSocketTerminalSession:
             try:
                 # Try Claude CLI first - check in user's shell environment
                 import shutil
-                import subprocess
                 
-                # Check if claude exists in user's shell environment
-                try:
+                # Check if claude exists in user's shell environment; a login shell is
+                # slow to start, so it is asked at most once per server process
+                claude_path = WebSocketTerminalSession._claude_path
+                if claude_path is None:
+                    # Search our own PATH in-process first; only fall back to spawning a
+                    # login shell when claude is installed somewhere only its profile adds
+                    claude_path = shutil.which('claude')
+                if claude_path is None and not WebSocketTerminalSession._claude_path_checked:
                     # Use bash to check if claude command exists with proper environment
-                    result = subprocess.run(['bash', '-l', '-c', 'which claude'], 
-                                          capture_output=True, text=True, timeout=5)
-                    claude_path = result.stdout.strip() if result.returncode == 0 else None
-                except Exception:
-                    claude_path = None
+                    claude_path = _find_claude_via_login_shell()
+                    WebSocketTerminalSession._claude_path = claude_path or None
+                    WebSocketTerminalSession._claude_path_checked = True
                 
                 if claude_path:
                     self.terminal_logger.info(f"Found Claude CLI at: {claude_path}")
@@ -118,7 +162,7 @@ class WebSocketTerminalSession:
             # Log detailed PTY spawn error with environment context
             error_context = {
                 'command': ['claude'],
-                'working_directory': os.getcwd(),
+                'working_directory': _PROJECT_DIR,
                 'path_env': os.environ.get('PATH', 'Not set'),
                 'user_env': os.environ.get('USER', 'Not set'),
                 'shell_env': os.environ.get('SHELL', 'Not set'),
@@ -396,11 +440,11 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
     
     def __init__(self, *args, **kwargs):
         # Set the directory to serve files from (project root)
-        super().__init__(*args, directory=str(Path(__file__).parent), **kwargs)
+        super().__init__(*args, directory=_SERVER_DIR_STR, **kwargs)
         
         # Initialize request logger with defensive pattern
         try:
-            self.request_logger = OrchestratorLogger("dashboard-requests")
+            self.request_logger = get_request_logger()
         except Exception as e:
             # Fallback if OrchestratorLogger fails to initialize
             print(f"[WARNING] Failed to initialize request_logger: {e}")
@@ -431,17 +475,17 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             elif self.path.endswith('.log'):
                 # Serve log files from project root
                 log_filename = self.path[1:]  # Remove leading slash
-                log_file_path = Path.cwd() / log_filename
+                log_file_path = os.path.join(_PROJECT_DIR, log_filename)
                 
-                if log_file_path.exists() and log_file_path.is_file():
+                if os.path.isfile(log_file_path):
                     self.send_response(200)
                     self.send_header('Content-type', 'text/plain; charset=utf-8')
                     self.send_header('Cache-Control', 'no-cache')
                     self.end_headers()
                     
-                    with open(log_file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        self.wfile.write(content.encode('utf-8'))
+                    # Logs are written as UTF-8, so pass the bytes through without decoding
+                    with open(log_file_path, 'rb') as f:
+                        self.wfile.write(f.read())
                     return
                 else:
                     # Log file not found
@@ -469,9 +513,13 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                         return
                     
                     # Build file path to dashboard directory
-                    dashboard_file_path = Path(__file__).parent / 'dashboard' / dashboard_relative_path
+                    dashboard_file_path = os.path.join(_SERVER_DIR_STR, 'dashboard', dashboard_relative_path)
+                    try:
+                        asset_stat = os.stat(dashboard_file_path)
+                    except OSError:
+                        asset_stat = None
                     
-                    if dashboard_file_path.exists() and dashboard_file_path.is_file():
+                    if asset_stat is not None and stat.S_ISREG(asset_stat.st_mode):
                         # Determine Content-Type based on file extension
                         if dashboard_relative_path.endswith('.js'):
                             content_type = 'application/javascript'
@@ -486,10 +534,8 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                         self.send_header('Cache-Control', 'max-age=3600')  # Cache for 1 hour
                         self.end_headers()
                         
-                        # Read and serve the file
-                        with open(dashboard_file_path, 'rb') as f:
-                            file_content = f.read()
-                            self.wfile.write(file_content)
+                        # Serve the file, re-reading it only when it has changed on disk
+                        self.wfile.write(_read_asset(dashboard_file_path, asset_stat.st_mtime_ns))
                         
                         # Log successful request
                         if hasattr(self, 'request_logger') and self.request_logger:
@@ -583,7 +629,6 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                 print(f"[{level.upper()}] {message}")
         
         try:
-            import subprocess
             import json
             import sys
             from pathlib import Path
@@ -605,7 +650,7 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             # Step 1: Kill all orchestrator processes (most aggressive cleanup)
             try:
                 subprocess.run(['pkill', '-9', '-f', 'orchestrate.py'], 
-                             capture_output=True, timeout=5)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 safe_log('info', "Killed orchestrator processes")
             except Exception as e:
                 safe_log('warning', f"Could not kill processes: {e}")
@@ -613,11 +658,11 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             # Step 2: Execute clear-ui command
             try:
                 clear_result = subprocess.run([sys.executable, 'orchestrate.py', 'clear-ui'], 
-                                            capture_output=True, text=True, timeout=20)
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=20)
                 if clear_result.returncode == 0:
                     safe_log('info', "Clear-UI completed successfully")
                 else:
-                    safe_log('warning', f"Clear-UI warning: {clear_result.stderr}")
+                    safe_log('warning', f"Clear-UI warning: {clear_result.stderr.decode('utf-8', 'replace')}")
             except Exception as e:
                 safe_log('error', f"Clear-UI failed: {e}")
             
@@ -775,7 +820,7 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
     def _handle_websocket_connection(self):
         """Handle WebSocket connection with terminal session"""
         # Create logger for WebSocket handling
-        websocket_logger = OrchestratorLogger("websocket-handler")
+        websocket_logger = OrchestratorLogger("websocket-handler", keep_open=False)
         websocket_logger.info("WebSocket connection established")
         
         terminal_session = None
@@ -875,7 +920,11 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
 
 def find_available_port(start_port, max_attempts=20):
     """Find an available port starting from start_port"""
-    for port in range(start_port, start_port + max_attempts):
+    # Try the requested range first, then the fallback range for the default port
+    candidates = range(start_port, start_port + max_attempts)
+    if start_port == 5678:
+        candidates = itertools.chain(candidates, range(6000, 6020))
+    for port in candidates:
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -884,17 +933,6 @@ def find_available_port(start_port, max_attempts=20):
         except OSError:
             continue
     
-    # If no ports in requested range, try fallback range
-    if start_port == 5678:
-        for port in range(6000, 6020):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                    sock.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-    
     raise OSError(f"No available ports found starting from {start_port}")
 
 
@@ -937,7 +975,7 @@ def start_dashboard_server(port=5678, host='localhost'):
     print(f"[DEBUG] Checking dashboard.html file...")
     
     # Check if dashboard.html exists
-    dashboard_file = Path(__file__).parent / 'dashboard.html'
+    dashboard_file = SERVER_DIR / 'dashboard.html'
     if not dashboard_file.exists():
         safe_log('warning', f"dashboard.html not found at {dashboard_file}")
         safe_log('info', "Dashboard will serve other files from the project root")
@@ -8,7 +8,6 @@ import os
 import time
 import threading
 from pathlib import Path
-from typing import Optional
 
 
 class LogStreamer:
@@ -18,6 +17,9 @@ class LogStreamer:
         self.log_file_path = log_file_path
         self.agent_name = agent_name
         self.initial_line_count = 0
+        self._read_offset = None
+        self._partial_line = b''
+        self._skip_to_newline = False
         self.streaming_thread = None
         self.stop_streaming = False
         self.is_active = False
@@ -28,26 +30,57 @@ class LogStreamer:
             return 0
         
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
+            # Count newline bytes in binary chunks; no need to decode the log to count it
+            count = 0
+            last_byte = b'\n'
+            with open(self.log_file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    count += chunk.count(b'\n')
+                    last_byte = chunk[-1:]
+            # A trailing line without a newline still counts as a line
+            return count if last_byte == b'\n' else count + 1
         except Exception as e:
             print(f"[LogStreamer] Error counting lines in {self.log_file_path}: {e}")
             return 0
     
-    def _read_lines_from_position(self, start_line: int) -> list:
-        """Read lines from the file starting at specified line number (1-indexed)"""
-        if not self.log_file_path.exists():
-            return []
-        
+    def _read_new_lines(self) -> list:
+        """Read the complete lines appended to the file since the previous call"""
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if start_line <= len(lines):
-                    return lines[start_line:]  # Convert to 0-indexed
-                return []
+            with open(self.log_file_path, 'rb') as f:
+                if self._read_offset is None:
+                    # First read: skip past the lines that existed when streaming started
+                    line = b''
+                    for _ in range(self.initial_line_count):
+                        line = f.readline()
+                        if not line:
+                            break
+                    # A line still being written at that point was counted as existing;
+                    # drop the rest of it instead of printing it as a fragment
+                    self._skip_to_newline = bool(line) and not line.endswith(b'\n')
+                else:
+                    f.seek(self._read_offset)
+                data = f.read()
+                self._read_offset = f.tell()
+        except FileNotFoundError:
+            return []
         except Exception as e:
             print(f"[LogStreamer] Error reading from {self.log_file_path}: {e}")
             return []
+        
+        if self._skip_to_newline:
+            newline = data.find(b'\n')
+            if newline == -1:
+                return []
+            data = data[newline + 1:]
+            self._skip_to_newline = False
+        
+        if not data:
+            return []
+        
+        # Hold back a trailing partial line until its newline arrives
+        lines = (self._partial_line + data).split(b'\n')
+        self._partial_line = lines.pop()
+        return [line.decode('utf-8', 'replace') for line in lines]
     
     def _format_log_line(self, line: str) -> str:
         """Format log line for terminal display - show all content as-is"""
@@ -61,26 +94,31 @@ class LogStreamer:
     
     def _streaming_loop(self):
         """Main streaming loop that runs in background thread"""
-        current_line_count = self.initial_line_count
         poll_interval = 0.1  # 100ms polling
         
         while not self.stop_streaming:
             try:
-                new_lines = self._read_lines_from_position(current_line_count)
-                
-                if new_lines:
-                    for line in new_lines:
-                        formatted_line = self._format_log_line(line)
-                        if formatted_line:
-                            print(f"  {formatted_line}")
-                    
-                    current_line_count += len(new_lines)
+                # Only the bytes appended since the last poll are read; the new lines
+                # are written to the terminal together rather than one print each
+                output_lines = []
+                for line in self._read_new_lines():
+                    formatted_line = self._format_log_line(line)
+                    if formatted_line:
+                        output_lines.append(f"  {formatted_line}")
+                if output_lines:
+                    print('\n'.join(output_lines))
                 
                 time.sleep(poll_interval)
                 
             except Exception as e:
                 print(f"[LogStreamer] Streaming error: {e}")
                 time.sleep(poll_interval)
+        
+        # Show a final line that was written without a trailing newline
+        if self._partial_line:
+            formatted_line = self._format_log_line(self._partial_line.decode('utf-8', 'replace'))
+            if formatted_line:
+                print(f"  {formatted_line}")
     
     def start_streaming(self):
         """Start streaming new log entries"""
@@ -89,6 +127,9 @@ class LogStreamer:
         
         # Capture baseline line count
         self.initial_line_count = self._get_file_line_count()
+        self._read_offset = None
+        self._partial_line = b''
+        self._skip_to_newline = False
         
         # Start streaming thread
         self.stop_streaming = False
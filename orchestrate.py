@@ -7,15 +7,18 @@ Implements configurable agent types and workflow sequences
 
 import json
 import os
+import shutil
+import stat
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import re
 import sys
+import itertools
 import atexit
 import subprocess
-import webbrowser
+import tempfile
 import time
 import socket
 import argparse
@@ -23,19 +26,46 @@ import signal
 import threading
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from log_streamer import LogStreamer, should_stream_logs
-from workflow_status import StatusReader, get_workflow_status
+from workflow_status import get_status_reader
 from process_manager import ProcessManager
 from orchestrator_logger import OrchestratorLogger
 
+# Checklist line patterns, compiled once and shared by the task-checklist helpers
+UNCHECKED_TASK_RE = re.compile(r'^\s*-\s*\[\s*\]\s*')
+CHECKED_TASK_RE = re.compile(r'^\s*-\s*\[x\]\s*')
+TASK_ANNOTATION_RE = re.compile(r'\s*\(.*\)\s*$')
+USER_TASK_RE = re.compile(r'USER\s+(\w+)\s*([A-Z0-9]*)')
+
+# Template placeholders: {{variable}} in group 1, or a lone {variable} in group 2
+TEMPLATE_VAR_RE = re.compile(r'\{\{([^}]+)\}\}|(?<!\{)\{([^{}]+)\}(?!\})')
+
+# Verification verdict markers, each set scanned in one case-insensitive pass
+VERIFICATION_FAILURE_RE = re.compile(r'fail|needs_review|needs review|error|not ready|incomplete', re.IGNORECASE)
+VERIFICATION_SUCCESS_RE = re.compile(r'pass|success|complete', re.IGNORECASE)
+
+# Installed orchestrator location (server scripts, agent templates), resolved once
+INSTALL_DIR = os.path.expanduser("~/.claude-orchestrator")
+
+# Shared opener for probing our own localhost servers: built once and never routed
+# through http_proxy/https_proxy, which would otherwise intercept localhost requests
+LOCAL_HTTP = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+# Fixed marker/seed file bodies, stored as bytes so writes skip the per-call encode
+UNSUPERVISED_MARKER = b"# Unsupervised Mode Active\n\nAutomatically approves gates when criteria are met.\n"
+BOOTSTRAP_MARKER = b"active"
+EMPTY_CHECKLIST = b"# Tasks Checklist\n\n"
+
+
+def print_section(title, body=None):
+    """Print a ruled section banner, and optional body, in a single write"""
+    rule = "=" * 60
+    text = f"\n{rule}\n{title}\n{rule}"
+    if body is not None:
+        text += f"\n{body}\n{rule}"
+    print(text)
 
-def safe_preexec():
-    """Safe preexec function that handles different platforms and permissions"""
-    try:
-        os.setpgrp()
-    except (AttributeError, OSError):
-        # setpgrp might not be available on all platforms or might fail due to permissions
-        pass
 
 def is_vscode_remote_session():
     """Detect VS Code Remote-SSH session with robust error handling"""
@@ -55,6 +85,29 @@ def is_vscode_remote_session():
         return False
 
 
+def count_matching_processes(needle: str) -> int:
+    """Count processes whose command line contains needle (like `pgrep -f`)"""
+    if not os.path.isdir('/proc'):
+        # No procfs (e.g. macOS): fall back to pgrep
+        result = subprocess.run(['pgrep', '-f', needle], capture_output=True, text=True)
+        return len(result.stdout.split()) if result.returncode == 0 else 0
+    
+    # Read /proc/<pid>/cmdline directly rather than forking pgrep to do the same scan
+    needle_bytes = needle.encode()
+    count = 0
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                    if needle_bytes in f.read():
+                        count += 1
+            except OSError:
+                continue  # Process exited mid-scan or is not readable
+    return count
+
+
 def cleanup_vscode_orphaned_ports():
     """Clean up orphaned processes that may be holding ports in VS Code Remote-SSH"""
     if not is_vscode_remote_session():
@@ -62,20 +115,26 @@ def cleanup_vscode_orphaned_ports():
     
     try:
         # Check for orphaned orchestrator processes
-        import subprocess
-        result = subprocess.run(['pgrep', '-f', 'cc-orchestrate'], capture_output=True, text=True)
-        if result.returncode == 0:
-            pids = result.stdout.strip().split('\n')
-            if len(pids) > 1:  # More than current process
-                print(f"Found {len(pids)} orchestrator processes - consider cleanup")
+        count = count_matching_processes('cc-orchestrate')
+        if count > 1:  # More than current process
+            print(f"Found {count} orchestrator processes - consider cleanup")
     except Exception:
         pass  # Silent failure for cleanup utilities
 
 
+# Overflow ranges tried once a server's default range is exhausted
+FALLBACK_PORT_RANGES = {
+    8000: range(9000, 9020),  # API server
+    5678: range(6000, 6020),  # Dashboard server
+}
+
+
 def find_available_port(start_port: int, max_attempts: int = 20) -> int:
     """Find an available port starting from start_port"""
-    # Try the requested range first
-    for port in range(start_port, start_port + max_attempts):
+    # Try the requested range first, then the server's fallback range (if any)
+    candidates = itertools.chain(range(start_port, start_port + max_attempts),
+                                 FALLBACK_PORT_RANGES.get(start_port, ()))
+    for port in candidates:
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -84,31 +143,46 @@ def find_available_port(start_port: int, max_attempts: int = 20) -> int:
         except OSError:
             continue
     
-    # If no ports in requested range, try higher ranges
-    if start_port == 8000:
-        # Try higher range for API server
-        for port in range(9000, 9020):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                    sock.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-    elif start_port == 5678:
-        # Try higher range for dashboard server
-        for port in range(6000, 6020):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                    sock.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-    
     raise OSError(f"No available port found in range {start_port}-{start_port + max_attempts - 1}")
 
 
+def capture_stderr_head(stream, limit: int = 1000):
+    """Drain a child's stderr pipe on a daemon thread, keeping only its first limit bytes
+    
+    Returns (head, thread); head fills in as output arrives. The pipe never fills up,
+    and memory stays bounded however much a long-running server logs.
+    """
+    head = bytearray()
+    
+    def drain():
+        with stream:
+            while True:
+                chunk = stream.read1(65536)
+                if not chunk:
+                    break
+                if len(head) < limit:
+                    head.extend(chunk[:limit - len(head)])
+    
+    thread = threading.Thread(target=drain, daemon=True)
+    thread.start()
+    return head, thread
+
+
+def wait_for_port(port: int, process=None, timeout: float = 10.0, host: str = 'localhost') -> bool:
+    """Poll until a server accepts connections on port; stop early if its process exits"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.25):
+                return True
+        except OSError:
+            pass
+        if process is not None and process.poll() is not None:
+            return False
+        time.sleep(0.05)
+    return False
+
+
 class OrchestratorDashboard:
     """Web dashboard for workflow visualization and gate control"""
     
@@ -205,6 +279,8 @@ class AgentConfig:
         self.process_manager = process_manager
         self.health_check_thread = None
         self.health_check_running = False
+        # Set to wake the health monitor immediately on shutdown
+        self._health_check_stop = threading.Event()
         self._load_config()
         
         if self.enable_dashboard:
@@ -258,47 +334,50 @@ class AgentConfig:
         ]
         
         for templates_dir in template_dirs:
-            if templates_dir.exists():
-                for agent_dir in templates_dir.iterdir():
-                    if agent_dir.is_dir():
-                        agent_type = agent_dir.name
-                        template_path = agent_dir / 'CLAUDE.md'
-                        if template_path.exists():
-                            try:
-                                content = template_path.read_text()
-                                template = self._parse_template_file(agent_type, content)
-                                # Validate template before adding
-                                if self.validate_template(template):
-                                    # Only add if not already loaded from config file or previous template location
-                                    # (config takes precedence, local templates take precedence over global)
-                                    if agent_type not in self.agents:
-                                        self.agents[agent_type] = template
-                                        debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
-                                        if debug_mode:
-                                            template_source = "local" if templates_dir == self.templates_dir else "global"
-                                            print(f"Info: Loaded {agent_type} template from {template_source} directory")
-                                    else:
-                                        debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
-                                        if debug_mode:
-                                            print(f"Info: Skipping template {agent_type} - already loaded from higher priority source")
-                                else:
-                                    print(f"Warning: Template validation failed for {agent_type}")
-                            except Exception as e:
-                                print(f"Warning: Failed to load template for {agent_type}: {e}")
+            # One directory listing per location; a missing location is simply skipped
+            try:
+                with os.scandir(templates_dir) as it:
+                    agent_dirs = [entry for entry in it if entry.is_dir()]
+            except OSError:
+                continue
+            for agent_dir in agent_dirs:
+                agent_type = agent_dir.name
+                template_path = Path(agent_dir.path) / 'CLAUDE.md'
+                try:
+                    content = template_path.read_text()
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    print(f"Warning: Failed to load template for {agent_type}: {e}")
+                    continue
+                try:
+                    template = self._parse_template_file(agent_type, content)
+                    # Validate template before adding
+                    if self.validate_template(template):
+                        # Only add if not already loaded from config file or previous template location
+                        # (config takes precedence, local templates take precedence over global)
+                        if agent_type not in self.agents:
+                            self.agents[agent_type] = template
+                            debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
+                            if debug_mode:
+                                template_source = "local" if templates_dir == self.templates_dir else "global"
+                                print(f"Info: Loaded {agent_type} template from {template_source} directory")
+                        else:
+                            debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
+                            if debug_mode:
+                                print(f"Info: Skipping template {agent_type} - already loaded from higher priority source")
+                    else:
+                        print(f"Warning: Template validation failed for {agent_type}")
+                except Exception as e:
+                    print(f"Warning: Failed to load template for {agent_type}: {e}")
                     
     def _parse_template_file(self, agent_name: str, content: str) -> AgentTemplate:
         """Parse template file content into AgentTemplate"""
         # Extract all variables from template content using regex
         variables = []
-        import re
-        
-        # Find all {{variable}} patterns
-        double_brace_vars = re.findall(r'\{\{([^}]+)\}\}', content)
-        # Find all {variable} patterns (excluding double braces)
-        single_brace_vars = re.findall(r'(?<!\{)\{([^{}]+)\}(?!\})', content)
         
-        # Combine and deduplicate variables
-        all_vars = list(set(double_brace_vars + single_brace_vars))
+        # Find {{variable}} and {variable} patterns in one scan of the template
+        all_vars = {match.group(1) or match.group(2) for match in TEMPLATE_VAR_RE.finditer(content)}
         variables = [var.strip() for var in all_vars if var.strip()]
             
         # Extract completion phrase if present - look for multiple patterns
@@ -392,7 +471,7 @@ class AgentConfig:
             }
             
         # Ensure directory exists
-        self.config_path.parent.mkdir(exist_ok=True)
+        os.makedirs(self.config_path.parent, exist_ok=True)
         
         with open(self.config_path, 'w') as f:
             json.dump(config_data, f, indent=2)
@@ -410,14 +489,17 @@ class AgentConfig:
                 self.dashboard_available = False
                 return
                 
+            # Server stdout is never read, and stderr is only inspected if start-up fails.
+            # Discard stdout; stderr goes to a pipe that is drained for the servers'
+            # lifetime (so it never fills and blocks them) keeping only its first 1000 bytes
             # Start API server as subprocess using installed version
-            orchestrator_dir = os.path.expanduser("~/.claude-orchestrator")
-            api_script = os.path.join(orchestrator_dir, "api_server.py")
+            api_script = os.path.join(INSTALL_DIR, "api_server.py")
             self.api_process = subprocess.Popen([
                 sys.executable, api_script, 
                 '--port', str(self.api_port),
                 '--project-root', str(self.project_root)
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=self.project_root, start_new_session=True, preexec_fn=safe_preexec)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=self.project_root, start_new_session=True)
+            api_stderr, api_stderr_thread = capture_stderr_head(self.api_process.stderr)
             
             # Register API process with ProcessManager if available
             if self.process_manager:
@@ -425,28 +507,26 @@ class AgentConfig:
             print(f"API server started as subprocess (PID: {self.api_process.pid}) on port {self.api_port}")
             
             # Start dashboard server as subprocess using installed version
-            dashboard_script = os.path.join(orchestrator_dir, "dashboard_server.py")
+            dashboard_script = os.path.join(INSTALL_DIR, "dashboard_server.py")
             # Set environment variable to ensure consistent ProcessManager mode
             dashboard_env = os.environ.copy()
             dashboard_env['CLAUDE_META_MODE'] = 'true' if self.meta_mode else 'false'
-            # Safe process group creation - fallback if setpgrp fails
-            def safe_setpgrp():
-                try:
-                    os.setpgrp()
-                except (OSError, PermissionError):
-                    pass  # Continue without process group if not allowed
             
             self.dashboard_process = subprocess.Popen([
                 sys.executable, dashboard_script, str(self.dashboard_port)
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=self.project_root, start_new_session=True, preexec_fn=safe_setpgrp, env=dashboard_env)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=self.project_root, start_new_session=True, env=dashboard_env)
+            dashboard_stderr, dashboard_stderr_thread = capture_stderr_head(self.dashboard_process.stderr)
             
             # Register dashboard process with ProcessManager if available
             if self.process_manager:
                 self.process_manager.register_process('dashboard_server', self.dashboard_process)
             print(f"Dashboard server started as subprocess (PID: {self.dashboard_process.pid}) on port {self.dashboard_port}")
             
-            # Give servers time to start
-            time.sleep(2)
+            # Wait until both servers accept connections (or exit) instead of a fixed delay.
+            # They boot in parallel, so both waits share one 10s budget
+            ports_deadline = time.monotonic() + 10
+            wait_for_port(self.api_port, self.api_process)
+            wait_for_port(self.dashboard_port, self.dashboard_process, timeout=max(0, ports_deadline - time.monotonic()))
             
             # Check if processes are still running
             api_running = self.api_process.poll() is None
@@ -460,6 +540,7 @@ class AgentConfig:
                 # Open dashboard in browser if not suppressed
                 if not self.no_browser:
                     try:
+                        import webbrowser
                         webbrowser.open(f'http://localhost:{self.dashboard_port}/dashboard/index.html')
                     except Exception as e:
                         print(f"Failed to open dashboard in browser: {e}")
@@ -475,16 +556,17 @@ class AgentConfig:
                 print("Orchestrator will continue without web dashboard")
                 self.dashboard_available = False
                 if not api_running:
-                    # Non-blocking stderr read with timeout
+                    # The process has exited, so its drain thread reaches EOF promptly
                     try:
-                        stderr_output = self.api_process.stderr.read(1000) if self.api_process.stderr else "No stderr"
+                        api_stderr_thread.join(timeout=1)
+                        stderr_output = bytes(api_stderr).decode('utf-8', 'replace') or "No stderr"
                         print(f"API server failed - stderr: {stderr_output}")
                     except Exception as e:
                         print(f"API server failed - Could not read stderr: {e}")
                 if not dashboard_running:
-                    # Non-blocking stderr read with timeout  
                     try:
-                        stderr_output = self.dashboard_process.stderr.read(1000) if self.dashboard_process.stderr else "No stderr"
+                        dashboard_stderr_thread.join(timeout=1)
+                        stderr_output = bytes(dashboard_stderr).decode('utf-8', 'replace') or "No stderr"
                         print(f"Dashboard server failed - stderr: {stderr_output}")
                     except Exception as e:
                         print(f"Dashboard server failed - Could not read stderr: {e}")
@@ -521,6 +603,7 @@ class AgentConfig:
             return
             
         self.health_check_running = True
+        self._health_check_stop.clear()
         self.health_check_thread = threading.Thread(target=self._health_monitor_loop, daemon=True)
         self.health_check_thread.start()
         print("Health monitoring started - checking every 30 seconds")
@@ -528,6 +611,7 @@ class AgentConfig:
     def stop_health_monitoring(self):
         """Stop health monitoring thread"""
         self.health_check_running = False
+        self._health_check_stop.set()
         if self.health_check_thread:
             self.health_check_thread.join(timeout=5)
     
@@ -535,8 +619,8 @@ class AgentConfig:
         """Health monitoring loop that runs in background thread"""
         while self.health_check_running:
             try:
-                time.sleep(30)  # 30-second intervals
-                if not self.health_check_running:
+                # 30-second intervals; returns early once stop_health_monitoring is called
+                if self._health_check_stop.wait(30) or not self.health_check_running:
                     break
                     
                 self._check_server_health()
@@ -553,9 +637,18 @@ class AgentConfig:
         api_running = self.api_process and self.api_process.poll() is None
         dashboard_running = self.dashboard_process and self.dashboard_process.poll() is None
         
-        # Check HTTP endpoint health
-        api_responsive = self._check_http_health(f"http://localhost:{self.api_port}/health")
-        dashboard_responsive = self._check_http_health(f"http://localhost:{self.dashboard_port}/")
+        # Check HTTP endpoint health; probe both servers concurrently so a hung
+        # one does not add its timeout on top of the other's. A server whose process
+        # has exited is reported from the cheap PID check alone, without a probe
+        api_responsive = dashboard_responsive = False
+        if api_running or dashboard_running:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                api_probe = pool.submit(self._check_http_health, f"http://localhost:{self.api_port}/health") if api_running else None
+                dashboard_probe = pool.submit(self._check_http_health, f"http://localhost:{self.dashboard_port}/") if dashboard_running else None
+                if api_probe is not None:
+                    api_responsive = api_probe.result()
+                if dashboard_probe is not None:
+                    dashboard_responsive = dashboard_probe.result()
         
         # Report issues
         if not api_running:
@@ -571,7 +664,7 @@ class AgentConfig:
     def _check_http_health(self, url: str, timeout: int = 5) -> bool:
         """Check if HTTP endpoint is responsive"""
         try:
-            with urllib.request.urlopen(url, timeout=timeout) as response:
+            with LOCAL_HTTP.open(url, timeout=timeout) as response:
                 return response.status == 200
         except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
             return False
@@ -726,9 +819,14 @@ class AgentFactory:
 class AgentExecutor:
     """Handles agent execution in both headless and interactive modes"""
     
+    # Claude CLI path found by the first headless run; avoids re-probing PATH per agent
+    _claude_binary = None
+    
     def __init__(self, orchestrator, headless=False):
         self.orchestrator = orchestrator
         self.outputs_dir = orchestrator.outputs_dir
+        # Set once the outputs directory has been created, so repeated agent runs skip the mkdir
+        self._outputs_dir_ready = False
         # Check headless flag first, then environment variable, default to interactive
         if headless:
             self.use_interactive_mode = False
@@ -761,72 +859,73 @@ class AgentExecutor:
         timeout_seconds = 300
         debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
         
-        # Unconditional debug to see if method is called
-        print(f"[TRACE] _execute_headless called for {agent_type}, debug_mode={debug_mode}")
-        
         if debug_mode:
+            print(f"[TRACE] _execute_headless called for {agent_type}, debug_mode={debug_mode}")
             print(f"[DEBUG] Starting headless execution for {agent_type}")
         
-        # Ensure directory exists
-        try:
-            self.outputs_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            return f"❌ {agent_type.upper()} failed: Cannot create working directory {self.outputs_dir}: {str(e)}"
+        # Ensure directory exists (only needed on the first run of this executor)
+        if not self._outputs_dir_ready:
+            try:
+                os.makedirs(self.outputs_dir, exist_ok=True)
+            except Exception as e:
+                return f"❌ {agent_type.upper()} failed: Cannot create working directory {self.outputs_dir}: {str(e)}"
+            self._outputs_dir_ready = True
         
         # Instructions are now clean from generation (no stripping needed)
         clean_instructions = instructions
         
         
-        # Validate Claude CLI availability
-        claude_binary = 'claude'
-        try:
-            # Debug: Log current PATH and environment
-            current_path = os.environ.get('PATH', '')
-            if debug_mode:
-                print(f"[DEBUG] Current PATH: {current_path}")
-                print(f"[DEBUG] Current working directory: {os.getcwd()}")
-                print(f"[DEBUG] Attempting to find claude command...")
-            
-            # Test if claude command is available
-            claude_test = subprocess.run(['which', claude_binary], capture_output=True, text=True)
-            if debug_mode:
-                print(f"[DEBUG] 'which claude' exit code: {claude_test.returncode}")
-                print(f"[DEBUG] 'which claude' stdout: {claude_test.stdout.strip()}")
-                print(f"[DEBUG] 'which claude' stderr: {claude_test.stderr.strip()}")
+        # Validate Claude CLI availability (resolved once per process, reused by later agents)
+        claude_binary = AgentExecutor._claude_binary
+        if claude_binary is None:
+            claude_binary = 'claude'
+            try:
+                # Debug: Log current PATH and environment
+                current_path = os.environ.get('PATH', '')
+                if debug_mode:
+                    print(f"[DEBUG] Current PATH: {current_path}")
+                    print(f"[DEBUG] Current working directory: {os.getcwd()}")
+                    print(f"[DEBUG] Attempting to find claude command...")
             
-            if claude_test.returncode != 0:
-                # Try alternative paths
-                alternative_paths = ['/usr/local/bin/claude', '/opt/homebrew/bin/claude', '~/.local/bin/claude']
-                claude_found = False
+                # Test if claude command is available on PATH (in-process, no `which` subprocess)
+                claude_path = shutil.which(claude_binary)
                 if debug_mode:
-                    print(f"[DEBUG] 'which' command failed, trying alternative paths...")
-                for alt_path in alternative_paths:
-                    expanded_path = os.path.expanduser(alt_path)
-                    exists = os.path.exists(expanded_path)
-                    executable = os.access(expanded_path, os.X_OK) if exists else False
+                    print(f"[DEBUG] PATH lookup for claude: {claude_path}")
+            
+                if claude_path is None:
+                    # Try alternative paths
+                    alternative_paths = ['/usr/local/bin/claude', '/opt/homebrew/bin/claude', '~/.local/bin/claude']
+                    claude_found = False
                     if debug_mode:
-                        print(f"[DEBUG] Checking {alt_path} -> {expanded_path}: exists={exists}, executable={executable}")
-                    if exists and executable:
-                        claude_binary = expanded_path
-                        claude_found = True
+                        print(f"[DEBUG] claude not on PATH, trying alternative paths...")
+                    for alt_path in alternative_paths:
+                        expanded_path = os.path.expanduser(alt_path)
+                        exists = os.path.exists(expanded_path)
+                        executable = os.access(expanded_path, os.X_OK) if exists else False
                         if debug_mode:
-                            print(f"[DEBUG] Found claude at: {claude_binary}")
-                        break
-                if not claude_found:
-                    error_msg = f"Claude CLI not found. PATH={current_path}. Checked locations: /usr/local/bin/claude, /opt/homebrew/bin/claude, ~/.local/bin/claude"
+                            print(f"[DEBUG] Checking {alt_path} -> {expanded_path}: exists={exists}, executable={executable}")
+                        if exists and executable:
+                            claude_binary = expanded_path
+                            claude_found = True
+                            if debug_mode:
+                                print(f"[DEBUG] Found claude at: {claude_binary}")
+                            break
+                    if not claude_found:
+                        error_msg = f"Claude CLI not found. PATH={current_path}. Checked locations: /usr/local/bin/claude, /opt/homebrew/bin/claude, ~/.local/bin/claude"
+                        if debug_mode:
+                            print(f"[DEBUG] {error_msg}")
+                        raise FileNotFoundError(error_msg)
+                else:
                     if debug_mode:
-                        print(f"[DEBUG] {error_msg}")
-                    raise FileNotFoundError(error_msg)
-            else:
-                if debug_mode:
-                    print(f"[DEBUG] Found claude via 'which': {claude_test.stdout.strip()}")
-                pass
-        except FileNotFoundError:
-            # Let FileNotFoundError propagate to parent method
-            raise
-        except Exception as e:
-            error_msg = self._sanitize_error_message(f"Claude CLI validation failed: {str(e)}")
-            raise FileNotFoundError(error_msg)
+                        print(f"[DEBUG] Found claude on PATH: {claude_path}")
+                    pass
+            except FileNotFoundError:
+                # Let FileNotFoundError propagate to parent method
+                raise
+            except Exception as e:
+                error_msg = self._sanitize_error_message(f"Claude CLI validation failed: {str(e)}")
+                raise FileNotFoundError(error_msg)
+            AgentExecutor._claude_binary = claude_binary
         
         cmd = [
             claude_binary,
@@ -846,7 +945,6 @@ class AgentExecutor:
         subprocess_env['CLAUDE_DISABLE_AUTO_UPDATE'] = '1'
         
         # Add deterministic start timestamp to agent log file
-        from datetime import datetime
         start_time = datetime.now()
         timestamp = start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
         log_file = self.outputs_dir / f"{agent_type}-log.md"
@@ -859,14 +957,9 @@ class AgentExecutor:
         start_log = f"\n## {timestamp} - {agent_type.upper()} Agent Session\n\n"
         task_header = f"---\nTASK: {task_for_header}\n---\n\n"
         
-        if log_file.exists():
-            with open(log_file, 'a') as f:
-                f.write(start_log)
-                f.write(task_header)
-        else:
-            with open(log_file, 'w') as f:
-                f.write(start_log)
-                f.write(task_header)
+        # Append mode creates the log if needed; write the header in one call
+        with open(log_file, 'a') as f:
+            f.write(start_log + task_header)
         
         try:
             if debug_mode:
@@ -875,23 +968,36 @@ class AgentExecutor:
                 print(f"[DEBUG] Environment PATH: {subprocess_env.get('PATH', 'NOT SET')}")
                 print(f"[DEBUG] Claude binary path: {claude_binary}")
             
-            result_process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout_seconds,
-                cwd=str(self.orchestrator.project_root),
-                env=subprocess_env
-            )
+            # The agent writes straight into temporary files, so there are no pipes
+            # to drain while it runs; the output is read and decoded once at the end
+            with tempfile.TemporaryFile() as stdout_sink, tempfile.TemporaryFile() as stderr_sink:
+                agent_process = subprocess.Popen(
+                    cmd,
+                    stdout=stdout_sink,
+                    stderr=stderr_sink,
+                    cwd=str(self.orchestrator.project_root),
+                    env=subprocess_env
+                )
+                try:
+                    exit_code = agent_process.wait(timeout=timeout_seconds)
+                except BaseException:
+                    # Timeout, Ctrl-C or any other error: never leave the agent running
+                    # (subprocess.run did the same)
+                    agent_process.kill()
+                    agent_process.wait()
+                    raise
+                stdout_sink.seek(0)
+                stderr_sink.seek(0)
+                stdout_bytes = stdout_sink.read()
+                stderr_bytes = stderr_sink.read()
             
-            exit_code = result_process.returncode
-            stdout_output = result_process.stdout
+            stdout_output = stdout_bytes.decode('utf-8', 'replace')
+            stderr_output = stderr_bytes.decode('utf-8', 'replace')
             
             if debug_mode:
                 print(f"[DEBUG] Command completed with exit code: {exit_code}")
                 print(f"[DEBUG] Stdout length: {len(stdout_output)} chars")
-                print(f"[DEBUG] Stderr length: {len(result_process.stderr)} chars")
-            stderr_output = result_process.stderr
+                print(f"[DEBUG] Stderr length: {len(stderr_output)} chars")
             
             # Show captured output only in debug mode
             if debug_mode:
@@ -1018,7 +1124,7 @@ class AgentExecutor:
         
         # Determine which SAGE file to use based on meta mode
         sage_filename = "SAGE-meta.md" if 'meta' in sys.argv else "SAGE.md"
-        sage_file = Path(sage_filename)  # Root project directory
+        sage_file = self.orchestrator.project_root / sage_filename  # Root project directory
         
         if not scribe_file.exists():
             return
@@ -1173,7 +1279,6 @@ class AgentExecutor:
                 log_content = f"Error reading log file: {e}"
         
         # Get current timestamp
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate different report templates based on agent type
@@ -1401,11 +1506,16 @@ Based on the agent execution:
             
         lines = log_content.split('\n')
         relevant_lines = []
+        # Lowercase the keywords once rather than per line
+        keywords_lower = [keyword.lower() for keyword in keywords]
         
         # Look for lines containing keywords
         for line in lines:
             line = line.strip()
-            if line and any(keyword.lower() in line.lower() for keyword in keywords):
+            if not line:
+                continue
+            line_lower = line.lower()
+            if any(keyword in line_lower for keyword in keywords_lower):
                 # Clean up log formatting
                 clean_line = line.replace('[', '').replace(']', '').strip()
                 if clean_line and len(clean_line) > 10:  # Filter out very short lines
@@ -1455,11 +1565,14 @@ Based on the agent execution:
                 "verifier": ["exploration.md", "success-criteria.md", "plan.md", "changes.md"]
             }
             
-            missing_inputs = []
-            for input_file in input_files.get(agent_type, []):
-                input_path = self.outputs_dir / input_file
-                if not input_path.exists():
-                    missing_inputs.append(input_file)
+            # One directory read instead of a stat per expected input
+            try:
+                with os.scandir(self.outputs_dir) as entries:
+                    present = {entry.name for entry in entries}
+            except OSError:
+                present = set()
+            missing_inputs = [input_file for input_file in input_files.get(agent_type, [])
+                              if input_file not in present]
             
             if missing_inputs:
                 error_parts.append(f"Missing required input files: {', '.join(missing_inputs)}")
@@ -1468,10 +1581,14 @@ Based on the agent execution:
         
         # Working directory info
         error_parts.append(f"Working directory: {self.outputs_dir}")
-        if not self.outputs_dir.exists():
+        # A single stat answers both "exists?" and "is it a directory?"
+        try:
+            outputs_is_dir = stat.S_ISDIR(os.stat(self.outputs_dir).st_mode)
+        except OSError:
             error_parts.append("ERROR: Working directory does not exist!")
-        elif not self.outputs_dir.is_dir():
-            error_parts.append("ERROR: Working directory path is not a directory!")
+        else:
+            if not outputs_is_dir:
+                error_parts.append("ERROR: Working directory path is not a directory!")
         
         # Claude CLI stdout (full output, not truncated)
         if stdout_output and stdout_output.strip():
@@ -1510,7 +1627,6 @@ Based on the agent execution:
             str_message = str_message.replace("failed: None", "failed: Error details unavailable")
         
         # Replace standalone None/null values but preserve context
-        import re
         # Replace "None" when it appears as a standalone value or at word boundaries
         str_message = re.sub(r'\bNone\b', 'unavailable', str_message)
         str_message = re.sub(r'\bnull\b', 'unavailable', str_message)
@@ -1542,6 +1658,15 @@ Based on the agent execution:
 class WorkflowConfig:
     """Configuration manager for workflow definitions"""
     
+    # Output file written by each built-in agent; other agents write "<agent>.md"
+    OUTPUT_FILES = {
+        "explorer": "exploration.md",
+        "planner": "plan.md",
+        "coder": "changes.md",
+        "scribe": "scribe.md",
+        "verifier": "verification.md"
+    }
+    
     def __init__(self, config_path: Path = None):
         self.config_path = config_path or Path('.claude/workflow-config.json')
         self.sequence = ["explorer", "criteria_gate", "planner", "coder", "verifier", "scribe", "completion_gate"]
@@ -1605,18 +1730,8 @@ class WorkflowConfig:
         
     def _get_output_file(self, agent_type: str) -> str:
         """Map agent type to its output file"""
-        if agent_type == "explorer":
-            return "exploration.md"
-        elif agent_type == "planner":
-            return "plan.md"
-        elif agent_type == "coder":
-            return "changes.md"
-        elif agent_type == "scribe":
-            return "scribe.md"
-        elif agent_type == "verifier":
-            return "verification.md"
-        else:
-            return f"{agent_type}.md"
+        output_file = self.OUTPUT_FILES.get(agent_type)
+        return output_file if output_file is not None else f"{agent_type}.md"
         
     def save_config(self):
         """Save current configuration to JSON file"""
@@ -1626,7 +1741,7 @@ class WorkflowConfig:
         }
         
         # Ensure directory exists
-        self.config_path.parent.mkdir(exist_ok=True)
+        os.makedirs(self.config_path.parent, exist_ok=True)
         
         with open(self.config_path, 'w') as f:
             json.dump(config_data, f, indent=2)
@@ -1635,21 +1750,53 @@ class WorkflowConfig:
 class ClaudeCodeOrchestrator:
     """Claude Code Orchestrator - Extensible agent workflow orchestration"""
     
-    def __init__(self, enable_dashboard: bool = False, dashboard_port: int = 5678, api_port: int = 8000, no_browser: bool = False, headless: bool = False):
+    # Workflow output files in display order, shared by the status writers
+    STATUS_FILES = (
+        ("exploration.md", "Explorer"),
+        ("success-criteria.md", "Criteria Gate"),
+        ("plan.md", "Planner"),
+        ("changes.md", "Coder"),
+        ("verification.md", "Verifier"),
+        ("scribe.md", "Scribe"),
+        ("completion-approved.md", "Completion Gate")
+    )
+    
+    # Per-task workflow files removed by clean_outputs
+    CLEANABLE_FILES = frozenset((
+        "exploration.md",
+        "success-criteria.md", 
+        "plan.md",
+        "changes.md", 
+        "verification.md",
+        "scribe.md",
+        "completion-approved.md",
+        "criteria-modification-request.md",
+        "pending-criteria-gate.md",
+        "pending-completion-gate.md",
+        "pending-user_validation-gate.md",
+        "current-status.md",
+        "current-user-validation.md",
+        "next-command.txt",
+        "status.txt"
+        # Note: orchestrator-log.md AND agent-log.md files are preserved for historical record
+    ))
+    
+    def __init__(self, enable_dashboard: bool = False, dashboard_port: int = 5678, api_port: int = 8000, no_browser: bool = False, headless: bool = False, project_root: Path = None):
         # Check for meta mode
         self.meta_mode = 'meta' in sys.argv
         
-        self.project_root = Path.cwd()
+        # Callers may pass the project root explicitly instead of chdir-ing into it
+        self.project_root = Path(project_root) if project_root is not None else Path.cwd()
         
-        # Initialize status reader early for path resolution
-        self.status_reader = StatusReader(project_root=self.project_root)
+        # Initialize status reader early for path resolution (shared per project root)
+        self.status_reader = get_status_reader(self.project_root)
         
         # Set directories using centralized path resolution with explicit mode
         mode = 'meta' if self.meta_mode else 'regular'
         self.claude_dir = self.status_reader._get_claude_dir(mode)
         self.outputs_dir = self.status_reader._get_outputs_dir(mode)
         
-        self.agents_dir = Path.home() / ".claude-orchestrator" / "agents"
+        self.agents_dir = Path(INSTALL_DIR) / "agents"
         
         # Task tracking files in .claude directory
         self.checklist_file = self.claude_dir / "task-checklist.md"
@@ -1691,9 +1838,8 @@ class ClaudeCodeOrchestrator:
         self._install_signal_handlers()
         
         # Ensure directories exist
-        self.claude_dir.mkdir(exist_ok=True)
-        self.agents_dir.mkdir(exist_ok=True)
-        self.outputs_dir.mkdir(exist_ok=True)
+        for directory in (self.claude_dir, self.agents_dir, self.outputs_dir):
+            os.makedirs(directory, exist_ok=True)
         
         # Status reader already initialized above for path resolution
         
@@ -1721,13 +1867,10 @@ class ClaudeCodeOrchestrator:
     def _test_api_endpoint(self):
         """Test if API server HTTP endpoint is responding"""
         try:
-            import urllib.request
-            import urllib.error
-            
             url = f'http://localhost:{self.api_port}/api/status?mode=meta'
             print(f"[Orchestrator] Testing API endpoint: {url}")
             
-            with urllib.request.urlopen(url, timeout=5) as response:
+            with LOCAL_HTTP.open(url, timeout=5) as response:
                 if response.status == 200:
                     print(f"[Orchestrator] API endpoint test passed")
                     return True
@@ -1744,13 +1887,10 @@ class ClaudeCodeOrchestrator:
     def _test_dashboard_endpoint(self):
         """Test if dashboard server HTTP endpoint is responding"""
         try:
-            import urllib.request
-            import urllib.error
-            
             url = f'http://localhost:{self.dashboard_port}/dashboard.html'
             print(f"[Orchestrator] Testing dashboard endpoint: {url}")
             
-            with urllib.request.urlopen(url, timeout=5) as response:
+            with LOCAL_HTTP.open(url, timeout=5) as response:
                 if response.status == 200:
                     print(f"[Orchestrator] Dashboard endpoint test passed")
                     return True
@@ -1788,7 +1928,7 @@ class ClaudeCodeOrchestrator:
             sage_template_content = self._get_sage_template()
             
         # Create SAGE file at project root if it doesn't exist
-        sage_file_path = Path.cwd() / sage_filename
+        sage_file_path = self.project_root / sage_filename
         if not sage_file_path.exists():
             sage_file_path.write_text(sage_template_content)
 
@@ -2033,10 +2173,16 @@ This file serves as SAGE's persistent working memory for meta mode operations in
         filepath.write_text(content)
         self._display_file_contents(filepath, description)
         
-    def _write_and_execute_command(self, command, description=""):
+    def _write_instruction_files(self, instructions, agent_name=None):
+        """Write instructions to next-command.txt and, if given, the agent's instructions file"""
+        data = instructions.encode('utf-8')
+        (self.outputs_dir / "next-command.txt").write_bytes(data)
+        if agent_name:
+            (self.outputs_dir / (agent_name + "-instructions.md")).write_bytes(data)
+        
+    def _write_and_execute_command(self, command, description="", agent_name=None):
         """Write instructions to file and instruct Claude to follow them"""
-        command_file = self.outputs_dir / "next-command.txt"
-        command_file.write_text(command)
+        self._write_instruction_files(command, agent_name)
         
         print("INSTRUCTION TO CLAUDE:")
         print("Read the file " + str(self.outputs_dir / "next-command.txt"))
@@ -2054,12 +2200,8 @@ This file serves as SAGE's persistent working memory for meta mode operations in
             clean_instructions = self._build_headless_agent_instructions(agent_name, primary_objective, work_section, completion_phrase)
             
             # In headless mode, only write to files - no need to print instructions since they're passed via -p
-            command_file = self.outputs_dir / "next-command.txt"
-            command_file.write_text(clean_instructions)
-            
-            # Also write to agent-specific file for reference
-            work_file = self.outputs_dir / (agent_name + "-instructions.md")
-            work_file.write_text(clean_instructions)
+            # (next-command.txt plus the agent-specific file for reference)
+            self._write_instruction_files(clean_instructions, agent_name)
             
             # In headless mode, return the actual clean instructions for execution
             return clean_instructions
@@ -2082,12 +2224,9 @@ This file serves as SAGE's persistent working memory for meta mode operations in
                                "FINAL STEP: Run the claude code command `/clear` to reset context, then run:\n" + \
                                "python3 ~/.claude-orchestrator/orchestrate.py continue" + headless_flag + meta_flag
         
-        # Write complete instructions to next-command.txt
-        self._write_and_execute_command(complete_instructions, "Reset context and start " + agent_name + " agent")
-        
-        # Also write to agent-specific file for reference
-        work_file = self.outputs_dir / (agent_name + "-instructions.md")
-        work_file.write_text(complete_instructions)
+        # Write complete instructions to next-command.txt, and to the agent-specific file for reference
+        self._write_and_execute_command(complete_instructions, "Reset context and start " + agent_name + " agent",
+                                        agent_name=agent_name)
         
         # In interactive mode, return the actual instructions for Claude to execute
         return complete_instructions
@@ -2164,9 +2303,7 @@ CRITICAL REQUIREMENTS:
         debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
         
         if debug_mode:
-            print("\n" + "="*60)
-            print(gate_content)
-            print("="*60)
+            print_section(gate_content)
         else:
             # Clean gate display for normal mode
             print(f"\n🚪 {gate_type.upper()} GATE: Human Review Required")
@@ -2223,8 +2360,7 @@ CRITICAL REQUIREMENTS:
                             if success:
                                 # Remove pending gate state
                                 gate_state_file = self.outputs_dir / f"pending-{gate_type}-gate.md"
-                                if gate_state_file.exists():
-                                    gate_state_file.unlink()
+                                gate_state_file.unlink(missing_ok=True)
                                 
                                 # Clean the workflow state for the new task (like CLI does)
                                 self.clean_outputs()
@@ -2246,8 +2382,7 @@ CRITICAL REQUIREMENTS:
                 elif user_input in valid_commands:
                     # Remove any pending gate state since we're proceeding
                     gate_state_file = self.outputs_dir / f"pending-{gate_type}-gate.md"
-                    if gate_state_file.exists():
-                        gate_state_file.unlink()
+                    gate_state_file.unlink(missing_ok=True)
                     
                     # Execute the gate decision
                     if user_input == "approve-criteria":
@@ -2643,11 +2778,7 @@ CRITICAL REQUIREMENTS:
                     agent, instructions = self.get_continue_agent()
                     debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
                     if debug_mode:
-                        print("\n" + "="*60)
-                        print("AUTO-CONTINUING TO " + agent.upper())
-                        print("="*60)
-                        print(instructions)
-                        print("="*60)
+                        print_section("AUTO-CONTINUING TO " + agent.upper(), instructions)
                     return agent, instructions
             
             exploration_content = exploration_file.read_text()
@@ -2674,15 +2805,14 @@ CRITICAL REQUIREMENTS:
             if not verification_file.exists():
                 return "error", "No verification.md found for completion approval"
             
+            # Read verification results once; both the unsupervised check and the gate use them
+            verification_content = verification_file.read_text()
+            
             # Check for unsupervised mode
             unsupervised_file = self.claude_dir / "unsupervised"
             if unsupervised_file.exists():
-                verification_content = verification_file.read_text()
-                verification_lower = verification_content.lower()
-                
                 # First check for explicit failure indicators - these BLOCK auto-approval
-                failure_indicators = ["fail", "needs_review", "needs review", "error", "not ready", "incomplete"]
-                if any(indicator in verification_lower for indicator in failure_indicators):
+                if VERIFICATION_FAILURE_RE.search(verification_content):
                     # Force interactive gate for failed verification
                     debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
                     if debug_mode:
@@ -2690,7 +2820,7 @@ CRITICAL REQUIREMENTS:
                     # Continue to interactive gate (don't auto-approve)
                     
                 # Only auto-approve on explicit success indicators
-                elif "pass" in verification_lower or "success" in verification_lower or "complete" in verification_lower:
+                elif VERIFICATION_SUCCESS_RE.search(verification_content):
                     # Auto-approve completion in unsupervised mode
                     debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
                     if debug_mode:
@@ -2705,8 +2835,6 @@ CRITICAL REQUIREMENTS:
                         print("Unsupervised mode: Ambiguous verification - forcing human review")
                     # Continue to interactive gate
             
-            verification_content = verification_file.read_text()
-            
             # Extract overall status
             status_line = "Status not found"
             for line in verification_content.split('\n'):
@@ -2735,9 +2863,9 @@ CRITICAL REQUIREMENTS:
             lines = content.split('\n')
             
             for line in lines:
-                if re.match(r'^\s*-\s*\[\s*\]\s*', line):
-                    task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                    task = re.sub(r'\s*\(.*\)\s*$', '', task)
+                if UNCHECKED_TASK_RE.match(line):
+                    task = UNCHECKED_TASK_RE.sub('', line)
+                    task = TASK_ANNOTATION_RE.sub('', task)
                     task = task.strip()
                     if task:
                         return task
@@ -2751,9 +2879,9 @@ CRITICAL REQUIREMENTS:
             lines = content.split('\n')
             
             for line in lines:
-                if re.match(r'^\s*-\s*\[\s*\]\s*', line):
-                    task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                    task = re.sub(r'\s*\(.*\)\s*$', '', task)
+                if UNCHECKED_TASK_RE.match(line):
+                    task = UNCHECKED_TASK_RE.sub('', line)
+                    task = TASK_ANNOTATION_RE.sub('', task)
                     task = task.strip()
                     
                     # Check if this is a USER task (validation, test, review, etc.)
@@ -2774,8 +2902,7 @@ CRITICAL REQUIREMENTS:
         self._current_validation_displayed = validation_key
         
         # Extract validation type and ID if present (e.g., "USER VALIDATION A", "USER TEST 3")
-        import re
-        match = re.match(r'USER\s+(\w+)\s*([A-Z0-9]*)', task)
+        match = USER_TASK_RE.match(task)
         if match:
             validation_type = match.group(1)
             validation_id = match.group(2) if match.group(2) else ""
@@ -2791,7 +2918,6 @@ CRITICAL REQUIREMENTS:
             task_details = task
         
         # Create gate content for the USER validation
-        from datetime import datetime
         gate_content = f"""# 🚪 USER VALIDATION GATE
 
 ## Validation Required: {validation_type} {validation_id}
@@ -2831,8 +2957,7 @@ CRITICAL REQUIREMENTS:
         validation_type = "VALIDATION"
         validation_id = ""
         
-        import re
-        match = re.match(r'USER\s+(\w+)\s*([A-Z0-9]*)', validation_task)
+        match = USER_TASK_RE.match(validation_task)
         if match:
             validation_type = match.group(1)
             validation_id = match.group(2) if match.group(2) else ""
@@ -2871,9 +2996,9 @@ CRITICAL REQUIREMENTS:
         user_task = None
         
         for i, line in enumerate(lines):
-            if re.match(r'^\s*-\s*\[\s*\]\s*', line):
-                task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                task = re.sub(r'\s*\(.*\)\s*$', '', task)
+            if UNCHECKED_TASK_RE.match(line):
+                task = UNCHECKED_TASK_RE.sub('', line)
+                task = TASK_ANNOTATION_RE.sub('', task)
                 task = task.strip()
                 
                 if task.startswith('USER'):
@@ -2918,9 +3043,9 @@ CRITICAL REQUIREMENTS:
         
         # Find the first incomplete USER validation task
         for line in lines:
-            if re.match(r'^\s*-\s*\[\s*\]\s*', line):
-                task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                task = re.sub(r'\s*\(.*\)\s*$', '', task)
+            if UNCHECKED_TASK_RE.match(line):
+                task = UNCHECKED_TASK_RE.sub('', line)
+                task = TASK_ANNOTATION_RE.sub('', task)
                 task = task.strip()
                 
                 if task.startswith('USER'):
@@ -2943,17 +3068,17 @@ CRITICAL REQUIREMENTS:
         
         for i, line in enumerate(lines):
             # Check if this is the current USER validation task
-            if re.match(r'^\s*-\s*\[\s*\]\s*', line):
-                task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                task = re.sub(r'\s*\(.*\)\s*$', '', task).strip()
+            if UNCHECKED_TASK_RE.match(line):
+                task = UNCHECKED_TASK_RE.sub('', line)
+                task = TASK_ANNOTATION_RE.sub('', task).strip()
                 if task.startswith('USER'):
                     user_task_found = True
                     break
             
             # Look for completed implementation tasks
-            if re.match(r'^\s*-\s*\[x\]\s*', line):
-                task = re.sub(r'^\s*-\s*\[x\]\s*', '', line)
-                task = re.sub(r'\s*\(.*\)\s*$', '', task).strip()
+            if CHECKED_TASK_RE.match(line):
+                task = CHECKED_TASK_RE.sub('', line)
+                task = TASK_ANNOTATION_RE.sub('', task).strip()
                 if not task.startswith('USER'):
                     last_impl_task_line = i
         
@@ -2969,8 +3094,8 @@ CRITICAL REQUIREMENTS:
         self.checklist_file.write_text('\n'.join(lines))
         
         # Extract task description for logging
-        task_desc = re.sub(r'^\s*-\s*\[\s*\]\s*', '', new_line)
-        task_desc = re.sub(r'\s*\(.*\)\s*$', '', task_desc).strip()
+        task_desc = UNCHECKED_TASK_RE.sub('', new_line)
+        task_desc = TASK_ANNOTATION_RE.sub('', task_desc).strip()
         
         print(f"🔄 Marked for retry: {task_desc}")
         return True
@@ -2981,7 +3106,7 @@ CRITICAL REQUIREMENTS:
             content = self.checklist_file.read_text()
             lines = content.split('\n')
             for line in lines:
-                if re.match(r'^\s*-\s*\[\s*\]\s*', line):
+                if UNCHECKED_TASK_RE.match(line):
                     return True
         return False
         
@@ -2992,20 +3117,10 @@ CRITICAL REQUIREMENTS:
         
         status_info = "# Orchestration Status\n\n"
         
-        files = [
-            ("exploration.md", "Explorer"),
-            ("success-criteria.md", "Criteria Gate"),
-            ("plan.md", "Planner"),
-            ("changes.md", "Coder"),
-            ("verification.md", "Verifier"),
-            ("scribe.md", "Scribe"),
-            ("completion-approved.md", "Completion Gate")
-        ]
-        
-        for filename, agent in files:
-            filepath = self.outputs_dir / filename
-            if filepath.exists():
-                size = filepath.stat().st_size
+        output_sizes = self._get_output_sizes()
+        for filename, agent in self.STATUS_FILES:
+            size = output_sizes.get(filename)
+            if size is not None:
                 status_info += "✓ " + agent.ljust(15) + " complete (" + str(size) + " bytes)\n"
             else:
                 status_info += "⏳ " + agent.ljust(15) + " pending\n"
@@ -3015,48 +3130,47 @@ CRITICAL REQUIREMENTS:
             status_info += "\nCurrent task: " + current_task + "\n"
             
         # Write status to file and display directly
-        status_filepath = self.outputs_dir / "current-status.md"
-        status_filepath.write_text(status_info)
+        self._write_status_file(status_info)
         print(status_info.strip())
 
+    def _get_output_sizes(self):
+        """Snapshot the outputs directory in one scan, mapping file name to size"""
+        sizes = {}
+        try:
+            with os.scandir(self.outputs_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+        except FileNotFoundError:
+            pass
+        return sizes
+
     def _update_status_file(self):
         """Update current-status.md file immediately without displaying"""
         status_info = "# Orchestration Status\n\n"
         
-        files = [
-            ("exploration.md", "Explorer"),
-            ("success-criteria.md", "Criteria Gate"),
-            ("plan.md", "Planner"),
-            ("changes.md", "Coder"),
-            ("verification.md", "Verifier"),
-            ("scribe.md", "Scribe"),
-            ("completion-approved.md", "Completion Gate")
-        ]
+        # One directory snapshot answers every size and pending-gate check below
+        output_sizes = self._get_output_sizes()
+        outputs = [(output_sizes.get(filename), agent) for filename, agent in self.STATUS_FILES]
+        validation_pending = "pending-user_validation-gate.md" in output_sizes
         
-        for filename, agent in files:
-            filepath = self.outputs_dir / filename
-            
+        for size, agent in outputs:
             # Check if this is a gate that's currently active
             is_active_gate = False
             if "Gate" in agent:
                 # Check for active gate files
                 gate_type = agent.lower().replace(" gate", "").replace(" ", "-")
-                active_gate_file = self.outputs_dir / f"pending-{gate_type}-gate.md"
-                pending_gate_file = self.outputs_dir / f"pending-{gate_type}-gate.md"
-                pending_validation_file = self.outputs_dir / "pending-user_validation-gate.md"
-                
-                if active_gate_file.exists() or pending_gate_file.exists() or (gate_type == "criteria" and pending_validation_file.exists()):
+                if f"pending-{gate_type}-gate.md" in output_sizes or (gate_type == "criteria" and validation_pending):
                     is_active_gate = True
                 
                 # Special case for Completion Gate: active when all previous steps are done but completion file doesn't exist
-                elif agent == "Completion Gate" and not filepath.exists():
+                elif agent == "Completion Gate" and size is None:
                     # Check if all previous steps are complete
                     all_previous_complete = True
-                    for prev_filename, prev_agent in files:
+                    for prev_size, prev_agent in outputs:
                         if prev_agent == "Completion Gate":
                             break  # Stop at completion gate
-                        prev_filepath = self.outputs_dir / prev_filename
-                        if not prev_filepath.exists():
+                        if prev_size is None:
                             all_previous_complete = False
                             break
                     
@@ -3065,8 +3179,7 @@ CRITICAL REQUIREMENTS:
             
             if is_active_gate:
                 status_info += "🔄 " + agent.ljust(15) + " active\n"
-            elif filepath.exists():
-                size = filepath.stat().st_size
+            elif size is not None:
                 status_info += "✓ " + agent.ljust(15) + " complete (" + str(size) + " bytes)\n"
             else:
                 status_info += "⏳ " + agent.ljust(15) + " pending\n"
@@ -3076,40 +3189,21 @@ CRITICAL REQUIREMENTS:
             status_info += "\nCurrent task: " + current_task + "\n"
             
         # Write status to file without displaying
-        status_filepath = self.outputs_dir / "current-status.md"
-        status_filepath.write_text(status_info)
+        self._write_status_file(status_info)
 
     def _update_status_file_with_running_agent(self, running_agent_type):
         """Update status file to show a specific agent as running"""
         status_info = "# Orchestration Status\n\n"
         
-        agent_mapping = {
-            "explorer": ("exploration.md", "Explorer"),
-            "planner": ("plan.md", "Planner"), 
-            "coder": ("changes.md", "Coder"),
-            "verifier": ("verification.md", "Verifier"),
-            "scribe": ("scribe.md", "Scribe")
-        }
-        
-        files = [
-            ("exploration.md", "Explorer"),
-            ("success-criteria.md", "Criteria Gate"),
-            ("plan.md", "Planner"),
-            ("changes.md", "Coder"),
-            ("verification.md", "Verifier"),
-            ("scribe.md", "Scribe"),
-            ("completion-approved.md", "Completion Gate")
-        ]
-        
-        for filename, agent in files:
-            filepath = self.outputs_dir / filename
+        output_sizes = self._get_output_sizes()
+        for filename, agent in self.STATUS_FILES:
+            size = output_sizes.get(filename)
             agent_type_key = agent.lower().replace(" gate", "").replace(" ", "_")
             
             if agent_type_key == running_agent_type or (agent_type_key == "criteria" and running_agent_type == "criteria_gate"):
                 # This agent is currently running
                 status_info += "🔄 " + agent.ljust(15) + " running\n"
-            elif filepath.exists():
-                size = filepath.stat().st_size
+            elif size is not None:
                 status_info += "✓ " + agent.ljust(15) + " complete (" + str(size) + " bytes)\n"
             else:
                 status_info += "⏳ " + agent.ljust(15) + " pending\n"
@@ -3119,6 +3213,10 @@ CRITICAL REQUIREMENTS:
             status_info += "\nCurrent task: " + current_task + "\n"
             
         # Write status to file
+        self._write_status_file(status_info)
+
+    def _write_status_file(self, status_info):
+        """Write current-status.md"""
         status_filepath = self.outputs_dir / "current-status.md"
         status_filepath.write_text(status_info)
 
@@ -3156,11 +3254,7 @@ CRITICAL REQUIREMENTS:
                       "When complete, say \"CRITERIA MODIFICATION COMPLETE\"\n\n" + \
                       "FINAL STEP: Execute the slash-command `/clear` to reset context, then execute the slash-command `/orchestrate continue`"
         
-        print("\n" + "="*60)
-        print("CRITERIA MODIFICATION TASK READY")
-        print("="*60)
-        print(instructions)
-        print("="*60)
+        print_section("CRITERIA MODIFICATION TASK READY", instructions)
         
     def retry_explorer(self):
         """Restart from Explorer phase"""
@@ -3193,8 +3287,7 @@ CRITICAL REQUIREMENTS:
             
             # Remove the pending criteria gate file since we've approved it
             criteria_gate_file = self.outputs_dir / "pending-criteria-gate.md"
-            if criteria_gate_file.exists():
-                criteria_gate_file.unlink()
+            criteria_gate_file.unlink(missing_ok=True)
             
             # Update status file after criteria approval
             self._update_status_file()
@@ -3204,18 +3297,7 @@ CRITICAL REQUIREMENTS:
             # Schedule next agent execution without waiting for it to complete
             if self.headless:
                 # Start continue command in background to avoid API timeout
-                import subprocess
-                import sys
-                background_process = subprocess.Popen([
-                    sys.executable, __file__, 'continue'
-                ] + (['meta'] if 'meta' in sys.argv else []), 
-                cwd=self.project_root, 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL, 
-                start_new_session=True, 
-                preexec_fn=safe_preexec)
-                # Register background process with ProcessManager for proper cleanup
-                self.process_manager.register_process('background_continue', background_process)
+                self._start_background_continue()
                 print("Background continue process started")
             else:
                 # In interactive mode, continue to next agent
@@ -3224,6 +3306,20 @@ CRITICAL REQUIREMENTS:
                     print(f"\nContinuing to {agent.upper()}")
                     self.run_agent(agent, instructions)
             
+    def _start_background_continue(self):
+        """Spawn a detached 'continue' run and register it with the ProcessManager"""
+        # start_new_session already puts the child in its own process group, so no
+        # preexec_fn is needed; leaving it out lets subprocess use the fast spawn path
+        background_process = subprocess.Popen(
+            [sys.executable, __file__, 'continue'] + (['meta'] if 'meta' in sys.argv else []),
+            cwd=self.project_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True)
+        # Register background process with ProcessManager for proper cleanup
+        self.process_manager.register_process('background_continue', background_process)
+        return background_process
+    
     def approve_completion(self):
         """Approve completion and mark task done"""
         task = self._get_current_task()
@@ -3256,25 +3352,10 @@ CRITICAL REQUIREMENTS:
                 # Already in headless mode, trigger headless workflow loop
                 # The loop will handle supervised vs unsupervised gate behavior
                 result_type, result = self._execute_headless_workflow_loop()
-                print("\n" + "="*60)
-                print(f"WORKFLOW RESULT: {result_type.upper()}")
-                print("="*60)
-                print(result)
-                print("="*60)
+                print_section(f"WORKFLOW RESULT: {result_type.upper()}", result)
             else:
                 # Start continue command in background to avoid API timeout
-                import subprocess
-                import sys
-                background_process = subprocess.Popen([
-                    sys.executable, __file__, 'continue'
-                ] + (['meta'] if 'meta' in sys.argv else []), 
-                cwd=self.project_root, 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL, 
-                start_new_session=True, 
-                preexec_fn=safe_preexec)
-                # Register background process with ProcessManager for proper cleanup
-                self.process_manager.register_process('background_continue', background_process)
+                background_process = self._start_background_continue()
                 print("\n" + "="*60)
                 print("AUTO-CONTINUING - Background process started")
                 print(f"Process PID: {background_process.pid}")
@@ -3294,7 +3375,6 @@ CRITICAL REQUIREMENTS:
                 self._update_checklist(task, completed=True)
             
             # Log the approval
-            from datetime import datetime
             approval_file = self.outputs_dir / "user-validation-approved.md"
             approval_content = f"""# User Validation Approved
 
@@ -3331,10 +3411,10 @@ Continuing to next task in workflow
             lines = content.split('\n')
             
             for line in lines:
-                if re.match(r'^\s*-\s*\[\s*\]\s*', line) and 'USER' in line:
+                if UNCHECKED_TASK_RE.match(line) and 'USER' in line:
                     # Extract the task text without the checkbox
-                    task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                    task = re.sub(r'\s*\(.*\)\s*$', '', task).strip()
+                    task = UNCHECKED_TASK_RE.sub('', line)
+                    task = TASK_ANNOTATION_RE.sub('', task).strip()
                     return task
         return None
         
@@ -3353,32 +3433,16 @@ Continuing to next task in workflow
     def clean_outputs(self):
         """Clean output directory for fresh run"""
         
-        # Only clean known orchestrator files
-        orchestrator_files = [
-            "exploration.md",
-            "success-criteria.md", 
-            "plan.md",
-            "changes.md", 
-            "verification.md",
-            "scribe.md",
-            "completion-approved.md",
-            "criteria-modification-request.md",
-            "pending-criteria-gate.md",
-            "pending-completion-gate.md",
-            "pending-user_validation-gate.md",
-            "current-status.md",
-            "current-user-validation.md",
-            "next-command.txt",
-            "status.txt"
-            # Note: orchestrator-log.md AND agent-log.md files are preserved for historical record
-        ]
-        
+        # Only clean known orchestrator files; one directory scan finds the ones present
         cleaned_count = 0
-        for filename in orchestrator_files:
-            filepath = self.outputs_dir / filename
-            if filepath.exists():
-                filepath.unlink()
-                cleaned_count += 1
+        try:
+            with os.scandir(self.outputs_dir) as entries:
+                for entry in entries:
+                    if entry.name in self.CLEANABLE_FILES and entry.is_file():
+                        os.unlink(entry.path)
+                        cleaned_count += 1
+        except FileNotFoundError:
+            pass
                 
         print(f"Cleaned {cleaned_count} orchestrator files from {self.outputs_dir}/")
         
@@ -3542,11 +3606,7 @@ QUESTIONS TO ASK USER:
 Begin by asking the user to identify the task type and provide relevant details.
 """
         
-        print("\n" + "="*60)
-        print("BOOTSTRAP MODE: Generating Task Structure for Any Work Type")
-        print("="*60)
-        print(bootstrap_instructions)
-        print("="*60)
+        print_section("BOOTSTRAP MODE: Generating Task Structure for Any Work Type", bootstrap_instructions)
 
     def bootstrap_with_validation(self):
         """Enhanced bootstrap that generates human-in-the-loop task structure"""
@@ -3559,7 +3619,7 @@ Begin by asking the user to identify the task type and provide relevant details.
         
         # Set bootstrap mode flag for agents
         bootstrap_flag = self.claude_dir / ".bootstrap-mode"
-        bootstrap_flag.write_text("active")
+        bootstrap_flag.write_bytes(BOOTSTRAP_MARKER)
         
         # Provide enhanced instructions with validation pattern
         print("\n" + "="*60)
@@ -3577,8 +3637,7 @@ Begin by asking the user to identify the task type and provide relevant details.
         self.bootstrap_tasks()
         
         # Clean up bootstrap flag after completion
-        if bootstrap_flag.exists():
-            bootstrap_flag.unlink()
+        bootstrap_flag.unlink(missing_ok=True)
         
     def _retry_from_phase(self, phase_name, display_name=None):
         """Generic retry method for any phase"""
@@ -3596,15 +3655,9 @@ Begin by asking the user to identify the task type and provide relevant details.
         if next_agent_result:
             if isinstance(next_agent_result, tuple):
                 next_agent_type, result = next_agent_result
-                print("\n" + "="*60)
-                print("RESTARTING FROM " + next_agent_type.upper())
-                print("="*60)
-                print(result)
-                print("="*60)
+                print_section("RESTARTING FROM " + next_agent_type.upper(), result)
             else:
-                print("\n" + "="*60)
-                print("RESTARTING FROM " + next_agent_result.upper())
-                print("="*60)
+                print_section("RESTARTING FROM " + next_agent_result.upper())
                 
     def _clean_from_phase(self, phase):
         """Clean outputs from specified phase onwards"""
@@ -3619,8 +3672,7 @@ Begin by asking the user to identify the task type and provide relevant details.
         files_to_clean = phase_files.get(phase, [])
         for filename in files_to_clean:
             filepath = self.outputs_dir / filename
-            if filepath.exists():
-                filepath.unlink()
+            filepath.unlink(missing_ok=True)
                 
         task = self._get_current_task()
         if task:
@@ -3632,7 +3684,7 @@ Begin by asking the user to identify the task type and provide relevant details.
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
         
         if not self.checklist_file.exists():
-            self.checklist_file.write_text("# Tasks Checklist\n\n")
+            self.checklist_file.write_bytes(EMPTY_CHECKLIST)
             
         content = self.checklist_file.read_text()
         lines = content.split('\n')
@@ -3643,12 +3695,12 @@ Begin by asking the user to identify the task type and provide relevant details.
             if '- [ ]' in line and (task[:50] in line or task.split(':')[0] in line):
                 if completed:
                     # Extract existing task text and add completion timestamp
-                    existing_task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                    existing_task = re.sub(r'\s*\(.*\)\s*$', '', existing_task).strip()
+                    existing_task = UNCHECKED_TASK_RE.sub('', line)
+                    existing_task = TASK_ANNOTATION_RE.sub('', existing_task).strip()
                     lines[i] = f"- [x] {existing_task} (Completed: {timestamp})"
                 else:
-                    existing_task = re.sub(r'^\s*-\s*\[\s*\]\s*', '', line)
-                    existing_task = re.sub(r'\s*\(.*\)\s*$', '', existing_task).strip()
+                    existing_task = UNCHECKED_TASK_RE.sub('', line)
+                    existing_task = TASK_ANNOTATION_RE.sub('', existing_task).strip()
                     lines[i] = f"- [ ] {existing_task} (Attempted: {timestamp})"
                 task_found = True
                 break
@@ -3675,7 +3727,7 @@ Begin by asking the user to identify the task type and provide relevant details.
     def enable_unsupervised_mode(self):
         """Enable unsupervised mode by creating .claude/unsupervised file"""
         unsupervised_file = self.claude_dir / "unsupervised"
-        unsupervised_file.write_text("# Unsupervised Mode Active\n\nAutomatically approves gates when criteria are met.\n")
+        unsupervised_file.write_bytes(UNSUPERVISED_MARKER)
         print(f"Unsupervised mode enabled - created {unsupervised_file}")
         
     def disable_unsupervised_mode(self):
@@ -3690,9 +3742,6 @@ Begin by asking the user to identify the task type and provide relevant details.
 
 def clear_ui_command(args):
     """Kill all dashboard and API server processes using ProcessManager"""
-    from process_manager import ProcessManager
-    import sys
-    
     print("Stopping all dashboard and API server processes...")
     
     try:
@@ -3745,10 +3794,7 @@ def serve_command(args):
     def open_dashboard_browser(url):
         """Open dashboard in browser, with VS Code Remote-SSH compatibility"""
         try:
-            import subprocess
-            import sys
             import webbrowser
-            
             # VS Code Remote-SSH environments should use webbrowser module first
             # as it's more likely to be intercepted by VS Code
             if is_remote:
@@ -3780,11 +3826,9 @@ def serve_command(args):
     # Health check function
     def check_server_health(host, port, endpoint="/", timeout=5):
         try:
-            import urllib.request
-            import urllib.error
             url = f"http://{host}:{port}{endpoint}"
-            response = urllib.request.urlopen(url, timeout=timeout)
-            return response.getcode() == 200
+            with LOCAL_HTTP.open(url, timeout=timeout) as response:
+                return response.getcode() == 200
         except (urllib.error.URLError, urllib.error.HTTPError, OSError):
             return False
     
@@ -3816,23 +3860,30 @@ def serve_command(args):
     # Health monitoring state
     health_monitoring_active = True
     health_check_thread = None
+    health_stop = threading.Event()
     
     def health_monitor():
         """Periodic health check for both servers"""
         while health_monitoring_active:
             try:
-                time.sleep(30)  # Check every 30 seconds
-                if not health_monitoring_active:
+                # Check every 30 seconds; shutdown sets health_stop to end the wait early
+                if health_stop.wait(30) or not health_monitoring_active:
                     break
                     
-                # Check dashboard health
-                if not check_server_health('localhost', dashboard_port):
-                    serve_logger.warning(f"Dashboard server on port {dashboard_port} is unresponsive")
-                
-                # Check API server health if it's running
-                running_processes = process_manager.get_running_processes()
-                if 'api_server' in running_processes:
-                    if not check_server_health('localhost', api_port, '/api/status'):
+                # Probe the dashboard in the background while the API server is checked,
+                # so an unresponsive server does not stack its timeout on the other's
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    dashboard_probe = pool.submit(check_server_health, 'localhost', dashboard_port)
+                    
+                    # Check API server health if it's running
+                    api_probe = None
+                    running_processes = process_manager.get_running_processes()
+                    if 'api_server' in running_processes:
+                        api_probe = pool.submit(check_server_health, 'localhost', api_port, '/api/status')
+                    
+                    if not dashboard_probe.result():
+                        serve_logger.warning(f"Dashboard server on port {dashboard_port} is unresponsive")
+                    if api_probe is not None and not api_probe.result():
                         serve_logger.warning(f"API server on port {api_port} is unresponsive")
                         
             except Exception as e:
@@ -3845,6 +3896,7 @@ def serve_command(args):
         
         serve_logger.info("Shutting down servers...")
         health_monitoring_active = False
+        health_stop.set()
         
         # Wait for health check thread to finish
         if health_check_thread and health_check_thread.is_alive():
@@ -3865,6 +3917,14 @@ def serve_command(args):
     signal.signal(signal.SIGINT, cleanup_and_exit)
     signal.signal(signal.SIGTERM, cleanup_and_exit)
     
+    # Exit codes of children reaped by the SIGCHLD handler. Popen.poll() reports 0 for a
+    # child it could no longer wait for, so the real code has to be kept here
+    reaped_exit_codes = {}
+    
+    def exit_code_of(process):
+        """Exit code of a finished server process, even if SIGCHLD reaped it first"""
+        return reaped_exit_codes.get(process.pid, process.returncode)
+    
     # Register SIGCHLD handler to reap zombie children automatically
     def handle_sigchld(signum, frame):
         """Reap zombie child processes"""
@@ -3874,6 +3934,7 @@ def serve_command(args):
                 pid, status = os.waitpid(-1, os.WNOHANG)
                 if pid == 0:  # No more zombies
                     break
+                reaped_exit_codes[pid] = os.waitstatus_to_exitcode(status)
                 serve_logger.debug(f"Reaped zombie child process {pid} with status {status}")
         except (OSError, ChildProcessError):
             # No children to reap
@@ -3884,86 +3945,81 @@ def serve_command(args):
     try:
         # Start API server as subprocess using the real api_server.py
         serve_logger.info(f"Starting API server on port {api_port}...")
-        orchestrator_dir = os.path.expanduser("~/.claude-orchestrator")
-        api_script = os.path.join(orchestrator_dir, "api_server.py")
+        api_script = os.path.join(INSTALL_DIR, "api_server.py")
         
         # Start API server from current project directory to read .agent-outputs files
         current_dir = os.getcwd()
         api_cmd = [sys.executable, api_script, "--port", str(api_port), "--no-browser", "--project-root", current_dir]
         
-        # Safe process group creation - fallback if setpgrp fails
-        def safe_setpgrp():
-            try:
-                os.setpgrp()
-            except (OSError, PermissionError):
-                pass  # Continue without process group if not allowed
-        
-        api_process = subprocess.Popen(api_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=current_dir, start_new_session=True, preexec_fn=safe_setpgrp)
+        # start_new_session already makes each server its own process group leader, so no
+        # setpgrp preexec_fn is needed and subprocess can use its fast vfork/posix_spawn path.
+        # Output is never read; a PIPE would eventually fill and block the server
+        api_process = subprocess.Popen(api_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=current_dir, start_new_session=True)
         process_manager.register_process('api_server', api_process)
         serve_logger.info(f"API server registered (PID: {api_process.pid})")
         
-        # Give API server time to start
-        time.sleep(2)
-        
-        # Verify API server started
-        if check_server_health('localhost', api_port, '/api/status'):
-            serve_logger.info(f"API server healthy on http://localhost:{api_port}")
-        else:
-            serve_logger.warning(f"API server may not have started properly on port {api_port}")
-        
         # Start health monitoring in background
         health_check_thread = threading.Thread(target=health_monitor, daemon=True)
         health_check_thread.start()
         
-        # Start dashboard server in background first
+        # Start dashboard server without waiting for the API server to come up
         serve_logger.info(f"Starting dashboard server on port {dashboard_port}...")
         serve_logger.info("Press Ctrl+C to stop all servers")
         serve_logger.info("-" * 50)
         
         # Start dashboard server using installed version only
-        dashboard_script = os.path.join(os.path.expanduser("~/.claude-orchestrator"), "dashboard_server.py")
+        dashboard_script = os.path.join(INSTALL_DIR, "dashboard_server.py")
         
         # Set environment variable to ensure consistent ProcessManager mode
         dashboard_env = os.environ.copy()
         dashboard_env['CLAUDE_META_MODE'] = 'true' if process_manager.meta_mode else 'false'
-        # Safe process group creation - fallback if setpgrp fails  
-        def safe_setpgrp_dash():
-            try:
-                os.setpgrp()
-            except (OSError, PermissionError):
-                pass  # Continue without process group if not allowed
         
         dashboard_process = subprocess.Popen([
             sys.executable, dashboard_script, str(dashboard_port)
-        ], cwd=current_dir, start_new_session=True, preexec_fn=safe_setpgrp_dash, env=dashboard_env)
+        ], cwd=current_dir, start_new_session=True, env=dashboard_env)
         process_manager.register_process('dashboard_server', dashboard_process)
         serve_logger.info(f"Dashboard server registered (PID: {dashboard_process.pid})")
         
+        # Both servers are now booting in parallel; verify the API server on a
+        # background thread so its readiness wait overlaps the dashboard's below
+        def verify_api_server():
+            wait_for_port(api_port, api_process)
+            if check_server_health('localhost', api_port, '/api/status'):
+                serve_logger.info(f"API server healthy on http://localhost:{api_port}")
+            else:
+                serve_logger.warning(f"API server may not have started properly on port {api_port}")
+        
+        api_check_thread = threading.Thread(target=verify_api_server, daemon=True)
+        api_check_thread.start()
+        # The check is bounded by its own waits: up to 10s for the port, then a 5s probe
+        api_check_deadline = time.monotonic() + 15
+        
         # Wait for dashboard server to be ready to serve actual pages
         serve_logger.info("Waiting for dashboard server to start...")
         dashboard_ready = False
         
-        # Give the subprocess time to actually start
-        time.sleep(2)
-        
-        # Import urllib modules at the top level
-        import urllib.request
-        import urllib.error
+        # Wait for the subprocess to start listening before probing the page
+        wait_for_port(dashboard_port, dashboard_process)
         
         for i in range(40):  # Wait up to 20 more seconds
+            # A dashboard process that has already exited can never become ready
+            if dashboard_process.poll() is not None:
+                serve_logger.error(f"Dashboard server exited during startup (code {exit_code_of(dashboard_process)})")
+                break
             try:
                 # Test the actual dashboard page, not just health
                 test_url = f"http://localhost:{dashboard_port}/dashboard.html"
                 try:
-                    response = urllib.request.urlopen(test_url, timeout=3)
-                    if response.getcode() == 200:
+                    with LOCAL_HTTP.open(test_url, timeout=3) as response:
+                        page_ok = response.getcode() == 200
+                    if page_ok:
                         # Try multiple times to be absolutely sure
                         success_count = 0
                         for verify in range(3):
                             try:
-                                verify_response = urllib.request.urlopen(test_url, timeout=1)
-                                if verify_response.getcode() == 200:
-                                    success_count += 1
+                                with LOCAL_HTTP.open(test_url, timeout=1) as verify_response:
+                                    if verify_response.getcode() == 200:
+                                        success_count += 1
                             except:
                                 break
                             time.sleep(0.1)
@@ -3982,6 +4038,12 @@ def serve_command(args):
         if not dashboard_ready:
             serve_logger.warning(f"Dashboard server may not have started properly on port {dashboard_port}")
         
+        # Report the API server's status before announcing the endpoints, but never let a
+        # hung probe hold up start-up beyond the check's own time budget
+        api_check_thread.join(timeout=max(0, api_check_deadline - time.monotonic()))
+        if api_check_thread.is_alive():
+            serve_logger.warning(f"API server health check on port {api_port} did not finish in time")
+        
         # Open browser immediately once dashboard is confirmed ready
         # Use 127.0.0.1 for consistency in VS Code Remote-SSH
         dashboard_url = f"http://127.0.0.1:{dashboard_port}" if is_vscode_remote_session() else f"http://localhost:{dashboard_port}"
@@ -4007,10 +4069,12 @@ def serve_command(args):
         serve_logger.info(f"Dashboard UI at: {dashboard_url}/dashboard.html") 
         serve_logger.info(f"Health check at: {dashboard_url}/health")
         
-        # Keep the main process alive and wait for signals
+        # Keep the main process alive and wait for signals, polling the dashboard
+        # server so serve shuts down instead of idling if it exits on its own
         try:
-            while True:
+            while dashboard_process.poll() is None:
                 time.sleep(1)
+            serve_logger.warning(f"Dashboard server exited (code {exit_code_of(dashboard_process)})")
         except KeyboardInterrupt:
             pass
         
@@ -4024,19 +4088,24 @@ def serve_command(args):
         cleanup_and_exit()
 
 
+# Command summary printed by show_help, assembled once and written in a single call
+HELP_TEXT = "\n".join([
+    "\nAvailable commands:",
+    "  Workflow: start, continue, interactive, status, clean, complete, fail, bootstrap",
+    "  Gates: approve-criteria, modify-criteria, retry-explorer",
+    "         approve-completion, retry-from-planner, retry-from-coder, retry-from-verifier",
+    "         user-approve, new-task [description] - Create new task during user validation",
+    "  Mode: unsupervised, supervised",
+    "  UI: serve - Start dashboard and API servers",
+    "      clear-ui - Stop all dashboard and API server processes",
+    "      killall - Force terminate all orchestrator processes (clear-ui + pkill)",
+    "      stop - Stop orchestrator processes system-wide",
+    "  Interactive mode: Runs persistent workflow with interactive gates",
+]) + "\n"
+
 def show_help():
     """Display help information about available commands"""
-    print("\nAvailable commands:")
-    print("  Workflow: start, continue, interactive, status, clean, complete, fail, bootstrap")
-    print("  Gates: approve-criteria, modify-criteria, retry-explorer")
-    print("         approve-completion, retry-from-planner, retry-from-coder, retry-from-verifier")
-    print("         user-approve, new-task [description] - Create new task during user validation")
-    print("  Mode: unsupervised, supervised")
-    print("  UI: serve - Start dashboard and API servers")
-    print("      clear-ui - Stop all dashboard and API server processes")
-    print("      killall - Force terminate all orchestrator processes (clear-ui + pkill)")
-    print("      stop - Stop orchestrator processes system-wide")
-    print("  Interactive mode: Runs persistent workflow with interactive gates")
+    sys.stdout.write(HELP_TEXT)
 
 def main():
     """CLI entry point - designed for actual workflow operations"""
@@ -4059,38 +4128,79 @@ def main():
     if command == "meta" or (command == "" and "meta" in sys.argv):
         command = "continue"
     
+    # Process-control commands don't use the workflow orchestrator; handle them before
+    # constructing it so they skip template loading, config generation and PID registration
+    # (serve and clear-ui stay below: they rely on that set-up having run)
+    if command == "stop":
+        # Stop all orchestrator processes system-wide
+        # Check if running in meta mode
+        meta_mode = 'meta' in sys.argv
+        process_manager = ProcessManager(meta_mode=meta_mode)
+        success = process_manager.cleanup_system_wide()
+        if success:
+            print("All orchestrator processes have been stopped.")
+            sys.exit(0)
+        else:
+            print("Warning: Some processes may not have been terminated properly.")
+            sys.exit(1)
+        
+    elif command == "killall":
+        # Force kill all orchestrator processes and clean up everything
+        print("🚫 KILLALL: Terminating all orchestrator processes...")
+        
+        # First, try to stop UI servers cleanly
+        try:
+            clear_ui_command(args)
+        except:
+            pass  # Ignore errors, we'll force kill everything anyway
+        
+        # Skip ProcessManager cleanup - it's hanging. Go straight to force kill.
+        print("Skipping ProcessManager cleanup (causes hangs) - using direct force kill...")
+        
+        # Always perform final cleanup: force kill any remaining orchestrator processes
+        print("Performing final cleanup with pkill...")
+        try:
+            result = subprocess.run([
+                "pkill", "-9", "-f", "dashboard_server.py|api_server.py|cc-orchestrate|orchestrate.py|cc-morchestrate"
+            ], capture_output=True, text=True, timeout=5)
+            
+            # Small delay to let processes terminate
+            time.sleep(0.5)
+            
+            print("✓ Force kill completed - all orchestrator processes should be terminated.")
+            
+        except subprocess.TimeoutExpired:
+            print("⚠ Warning: pkill command timed out, but processes may still be terminated.")
+        except Exception as e:
+            print(f"Error during force kill: {e}")
+            print("Some processes may still be running.")
+        
+    elif command == "help":
+        show_help()
+        
+    if command in ("stop", "killall", "help"):
+        return
+    
     orchestrator = ClaudeCodeOrchestrator(no_browser=args.no_browser, headless=not args.interactive)
     
     # Basic workflow commands
     if command == "start":
         # Start workflow with existing state
         agent, instructions = orchestrator.get_continue_agent()
-        print("\n" + "="*60)
-        print("STARTING - AGENT: " + agent.upper())
-        print("="*60)
-        print(instructions)
-        print("="*60)
+        print_section("STARTING - AGENT: " + agent.upper(), instructions)
         
     elif command == "continue":
         agent, instructions = orchestrator.get_continue_agent()
         
         # Handle new task creation by automatically continuing
         if agent == "new_task_created":
-            print("\n" + "="*60)
-            print("AGENT: " + agent.upper())
-            print("="*60)
-            print(instructions)
-            print("="*60)
+            print_section("AGENT: " + agent.upper(), instructions)
             print()
             
             # Automatically continue to the newly created task
             agent, instructions = orchestrator.get_continue_agent()
         
-        print("\n" + "="*60)
-        print("AGENT: " + agent.upper())
-        print("="*60)
-        print(instructions)
-        print("="*60)
+        print_section("AGENT: " + agent.upper(), instructions)
         
     elif command == "interactive":
         # Start persistent interactive workflow
@@ -4194,8 +4304,7 @@ def main():
             if success:
                 # Remove pending gate state
                 gate_state_file = orchestrator.outputs_dir / "pending-user_validation-gate.md"
-                if gate_state_file.exists():
-                    gate_state_file.unlink()
+                gate_state_file.unlink(missing_ok=True)
                 
                 # Clean the workflow state for the new task (like CLI does)
                 orchestrator.clean_outputs()
@@ -4226,63 +4335,14 @@ def main():
     elif command == "supervised":
         orchestrator.disable_unsupervised_mode()
         
-    elif command == "stop":
-        # Stop all orchestrator processes system-wide
-        # Check if running in meta mode
-        meta_mode = 'meta' in sys.argv
-        process_manager = ProcessManager(meta_mode=meta_mode)
-        success = process_manager.cleanup_system_wide()
-        if success:
-            print("All orchestrator processes have been stopped.")
-            sys.exit(0)
-        else:
-            print("Warning: Some processes may not have been terminated properly.")
-            sys.exit(1)
-        
-    elif command == "killall":
-        # Force kill all orchestrator processes and clean up everything
-        print("🚫 KILLALL: Terminating all orchestrator processes...")
-        
-        # Check if running in meta mode
-        meta_mode = 'meta' in sys.argv
-        process_manager = ProcessManager(meta_mode=meta_mode)
-        
-        # First, try to stop UI servers cleanly
-        try:
-            clear_ui_command(args)
-        except:
-            pass  # Ignore errors, we'll force kill everything anyway
-        
-        # Skip ProcessManager cleanup - it's hanging. Go straight to force kill.
-        print("Skipping ProcessManager cleanup (causes hangs) - using direct force kill...")
-        
-        # Always perform final cleanup: force kill any remaining orchestrator processes
-        print("Performing final cleanup with pkill...")
-        try:
-            result = subprocess.run([
-                "pkill", "-9", "-f", "dashboard_server.py|api_server.py|cc-orchestrate|orchestrate.py|cc-morchestrate"
-            ], capture_output=True, text=True, timeout=5)
-            
-            # Small delay to let processes terminate
-            time.sleep(0.5)
-            
-            print("✓ Force kill completed - all orchestrator processes should be terminated.")
-            
-        except subprocess.TimeoutExpired:
-            print("⚠ Warning: pkill command timed out, but processes may still be terminated.")
-        except Exception as e:
-            print(f"Error during force kill: {e}")
-            print("Some processes may still be running.")
-        
     elif command == "serve":
+        # Runs after the orchestrator is built so a fresh project gets its .claude/ and
+        # output directories and default configs before the servers read from them
         serve_command(args)
         
     elif command == "clear-ui":
         clear_ui_command(args)
         
-    elif command == "help":
-        show_help()
-        
     else:
         print("Unknown command: " + command)
         show_help()
@@ -5,6 +5,7 @@ Extracted from duplicate implementations to eliminate code duplication
 """
 
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -12,13 +13,22 @@ from pathlib import Path
 class OrchestratorLogger:
     """Unified logging system for all orchestrator components"""
     
-    def __init__(self, component_name: str, log_dir: Path = None):
+    def __init__(self, component_name: str, log_dir: Path = None, keep_open: bool = True):
         self.component_name = component_name
         self.log_dir = log_dir or Path.cwd()
         self.log_file = self.log_dir / f"{component_name}.log"
         
-        # Ensure log directory exists
-        self.log_dir.mkdir(exist_ok=True)
+        # Append handle opened on first write and kept for the logger's lifetime;
+        # line buffering still hands every entry to the OS as soon as it is written.
+        # Short-lived loggers that are never shut down pass keep_open=False instead
+        self.keep_open = keep_open
+        self._log_handle = None
+        # Reentrant, since signal handlers may log while the main thread is mid-write
+        self._log_lock = threading.RLock()
+        
+        # Ensure log directory exists (the current directory always does)
+        if log_dir is not None:
+            self.log_dir.mkdir(exist_ok=True)
         
         # Initialize log file with startup message
         self._write_log(f"=== {component_name.upper()} STARTED ===")
@@ -29,8 +39,14 @@ class OrchestratorLogger:
         log_entry = f"[{timestamp}] [{level}] {message}\n"
         
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            if not self.keep_open:
+                with open(self.log_file, 'a', encoding='utf-8') as f:
+                    f.write(log_entry)
+                return
+            with self._log_lock:
+                if self._log_handle is None:
+                    self._log_handle = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+                self._log_handle.write(log_entry)
         except Exception as e:
             # Fallback to stderr if log file writing fails
             print(f"Log write failed: {e}", file=sys.stderr)
@@ -57,4 +73,8 @@ class OrchestratorLogger:
     
     def shutdown(self):
         """Log shutdown message"""
-        self._write_log(f"=== {self.component_name.upper()} SHUTDOWN ===")
\ No newline at end of file
+        self._write_log(f"=== {self.component_name.upper()} SHUTDOWN ===")
+        with self._log_lock:
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
\ No newline at end of file
@@ -1,11 +1,14 @@
 import json
 import os
+import select
 import signal
 import subprocess
+import threading
 import time
 import psutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class ProcessManager:
@@ -20,6 +23,9 @@ class ProcessManager:
             self.pid_file = self.config_dir / 'pids.json'
             
         self.processes: Dict[str, subprocess.Popen] = {}
+        # Serialises PID-file read-modify-write cycles when processes are registered
+        # or stopped from several threads at once
+        self._pid_file_lock = threading.Lock()
         self._ensure_config_dir()
         self._load_pids()
         
@@ -50,6 +56,7 @@ class ProcessManager:
                 if self._is_process_running(pid):
                     active_pids[name] = pid  # Keep old format for backward compatibility
         self._save_pids(active_pids)
+        return active_pids
     
     def _save_pids(self, data: Dict):
         with open(self.pid_file, 'w') as f:
@@ -96,97 +103,81 @@ class ProcessManager:
     
     def register_process(self, name: str, process: subprocess.Popen):
         print(f"[ProcessManager] Registering process '{name}' (PID: {process.pid}) to {self.pid_file}")
-        self.processes[name] = process
-        
-        # Load current PIDs and clean up stale entries
-        current_pids = {}
-        if self.pid_file.exists():
-            try:
-                with open(self.pid_file, 'r') as f:
-                    current_pids = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_pids = {}
-        
-        # Clean up stale PIDs first
-        self._cleanup_stale_pids(current_pids)
-        
-        # Reload the cleaned data
-        current_pids = {}
-        if self.pid_file.exists():
+        with self._pid_file_lock:
+            self.processes[name] = process
+            
+            # Load current PIDs and clean up stale entries
+            current_pids = {}
+            if self.pid_file.exists():
+                try:
+                    with open(self.pid_file, 'r') as f:
+                        current_pids = json.load(f)
+                except (json.JSONDecodeError, FileNotFoundError):
+                    current_pids = {}
+            
+            # Clean up stale PIDs first and keep working on the cleaned data
+            current_pids = self._cleanup_stale_pids(current_pids)
+            
+            # Store both PID and PGID for process group management
             try:
-                with open(self.pid_file, 'r') as f:
-                    current_pids = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_pids = {}
-        
-        # Store both PID and PGID for process group management
-        try:
-            pgid = os.getpgid(process.pid)
-        except (OSError, ProcessLookupError):
-            pgid = process.pid  # Fallback to PID if PGID lookup fails
-        
-        current_pids[name] = {
-            'pid': process.pid,
-            'pgid': pgid
-        }
-        self._save_pids(current_pids)
-        print(f"[ProcessManager] Successfully registered '{name}' in {self.pid_file}")
+                pgid = os.getpgid(process.pid)
+            except (OSError, ProcessLookupError):
+                pgid = process.pid  # Fallback to PID if PGID lookup fails
+            
+            current_pids[name] = {
+                'pid': process.pid,
+                'pgid': pgid
+            }
+            self._save_pids(current_pids)
+            print(f"[ProcessManager] Successfully registered '{name}' in {self.pid_file}")
     
     def register_main_process(self, name: str, pid: int = None):
         """Register the main process by PID for system-wide tracking"""
         if pid is None:
             pid = os.getpid()
         
-        # Load current PIDs, update with main process, and save
-        current_pids = {}
-        if self.pid_file.exists():
+        with self._pid_file_lock:
+            # Load current PIDs, update with main process, and save
+            current_pids = {}
+            if self.pid_file.exists():
+                try:
+                    with open(self.pid_file, 'r') as f:
+                        current_pids = json.load(f)
+                except (json.JSONDecodeError, FileNotFoundError):
+                    current_pids = {}
+            
+            # Store both PID and PGID for main process too
             try:
-                with open(self.pid_file, 'r') as f:
-                    current_pids = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_pids = {}
-        
-        # Store both PID and PGID for main process too
-        try:
-            pgid = os.getpgid(pid)
-        except (OSError, ProcessLookupError):
-            pgid = pid  # Fallback to PID if PGID lookup fails
-        
-        current_pids[name] = {
-            'pid': pid,
-            'pgid': pgid
-        }
-        self._save_pids(current_pids)
+                pgid = os.getpgid(pid)
+            except (OSError, ProcessLookupError):
+                pgid = pid  # Fallback to PID if PGID lookup fails
+            
+            current_pids[name] = {
+                'pid': pid,
+                'pgid': pgid
+            }
+            self._save_pids(current_pids)
     
     def deregister_process(self, name: str):
-        if name in self.processes:
-            del self.processes[name]
-        
-        # Load current PIDs and clean up stale entries
-        current_pids = {}
-        if self.pid_file.exists():
-            try:
-                with open(self.pid_file, 'r') as f:
-                    current_pids = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_pids = {}
-        
-        # Clean up stale PIDs first
-        self._cleanup_stale_pids(current_pids)
-        
-        # Reload the cleaned data
-        current_pids = {}
-        if self.pid_file.exists():
-            try:
-                with open(self.pid_file, 'r') as f:
-                    current_pids = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_pids = {}
-        
-        # Remove the specific process
-        if name in current_pids:
-            del current_pids[name]
-        self._save_pids(current_pids)
+        with self._pid_file_lock:
+            self.processes.pop(name, None)
+            
+            # Load current PIDs and clean up stale entries
+            current_pids = {}
+            if self.pid_file.exists():
+                try:
+                    with open(self.pid_file, 'r') as f:
+                        current_pids = json.load(f)
+                except (json.JSONDecodeError, FileNotFoundError):
+                    current_pids = {}
+            
+            # Clean up stale PIDs first and keep working on the cleaned data
+            current_pids = self._cleanup_stale_pids(current_pids)
+            
+            # Remove the specific process
+            if name in current_pids:
+                del current_pids[name]
+            self._save_pids(current_pids)
     
     def is_process_healthy(self, name: str) -> bool:
         if name not in self.processes:
@@ -214,6 +205,39 @@ class ProcessManager:
         # Additional health check - verify PID still exists
         return self._is_process_running(process.pid)
     
+    def _wait_for_exit(self, process: Any, timeout: float) -> None:
+        """Block until process (a Popen or a PtyProcess) exits, raising TimeoutExpired like Popen.wait
+        
+        On Linux 5.3+ a Popen is waited for on a pidfd, so the exit is noticed as soon
+        as it happens instead of at Popen.wait's next polling interval.
+        """
+        if not isinstance(process, subprocess.Popen):
+            # e.g. the dashboard's PtyProcess terminals: no .args, and wait() takes no timeout
+            deadline = time.monotonic() + timeout
+            while process.isalive():
+                if time.monotonic() >= deadline:
+                    raise subprocess.TimeoutExpired(getattr(process, 'argv', str(process.pid)), timeout)
+                time.sleep(0.05)
+            return
+        
+        if process.returncode is None and hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None  # Already reaped or unsupported kernel - fall back below
+            if pidfd is not None:
+                try:
+                    # poll() rather than select(), which rejects descriptors >= FD_SETSIZE
+                    poller = select.poll()
+                    poller.register(pidfd, select.POLLIN)
+                    ready = poller.poll(timeout * 1000)
+                finally:
+                    os.close(pidfd)
+                if not ready:
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+        # Reap the exited child (immediate after a pidfd wakeup) or poll as before
+        process.wait(timeout=timeout)
+    
     def terminate_process(self, name: str, timeout: int = 10) -> bool:
         if name not in self.processes:
             return True
@@ -240,7 +264,7 @@ class ProcessManager:
                 return True
             
             try:
-                process.wait(timeout=timeout)
+                self._wait_for_exit(process, timeout=timeout)
                 print(f"Process {name} (PID: {pid}) and its group terminated gracefully")
                 self.deregister_process(name)
                 return True
@@ -260,7 +284,7 @@ class ProcessManager:
                     return True
                 
                 try:
-                    process.wait(timeout=force_timeout)
+                    self._wait_for_exit(process, timeout=force_timeout)
                     print(f"Process {name} (PID: {pid}) and its group force-killed")
                     self.deregister_process(name)
                     return True
@@ -274,13 +298,23 @@ class ProcessManager:
             return False
     
     def cleanup_all_processes(self, graceful_timeout: int = 10, force_timeout: int = 5) -> bool:
-        success = True
         process_names = list(self.processes.keys())
         
-        # First pass: graceful termination
-        for name in process_names:
-            if not self.terminate_process(name, graceful_timeout):
-                success = False
+        # First pass: graceful termination. Each stop can wait out its own timeouts,
+        # so stop the processes in parallel rather than one after another
+        if len(process_names) > 1:
+            with ThreadPoolExecutor(max_workers=len(process_names)) as pool:
+                futures = [(name, pool.submit(self.terminate_process, name, graceful_timeout)) for name in process_names]
+            results = []
+            for name, future in futures:
+                # A worker's exception would otherwise only surface from result(), aborting the rest
+                error = future.exception()
+                if error is not None:
+                    print(f"Error terminating process {name}: {error}")
+                results.append(error is None and future.result())
+        else:
+            results = [self.terminate_process(name, graceful_timeout) for name in process_names]
+        success = all(results)
         
         # Verify all processes are terminated
         for name in list(self.processes.keys()):
@@ -301,6 +335,9 @@ class ProcessManager:
             return True
         
         success = True
+        # Signal every process first so their graceful shutdowns overlap,
+        # then wait on all of them against one shared deadline
+        terminating = []
         for name, proc_info in pids.items():
             # Handle both old format (just PID) and new format (dict with pid/pgid)
             if isinstance(proc_info, dict):
@@ -321,50 +358,63 @@ class ProcessManager:
                         # Fallback to individual process if process group fails
                         os.kill(pid, signal.SIGTERM)
                         print(f"Sent SIGTERM to process {name} (PID: {pid})")
-                    
-                    # Wait for graceful termination
-                    for _ in range(100):  # 10 seconds at 0.1s intervals
-                        if not self._is_process_running(pid):
-                            print(f"Process {name} (PID: {pid}) and its group terminated gracefully")
-                            # Reap zombie processes to prevent accumulation
-                            self._reap_zombie_if_child(pid)
-                            break
-                        time.sleep(0.1)
-                    else:
-                        # Force kill if still running
-                        try:
-                            try:
-                                os.kill(-pgid, signal.SIGKILL)  # Use negative PID to target process group
-                                print(f"Sent SIGKILL to process group {pgid} for process {name} (PID: {pid})")
-                            except (OSError, ProcessLookupError):
-                                # Fallback to individual process if process group fails
-                                os.kill(pid, signal.SIGKILL)
-                                print(f"Sent SIGKILL to process {name} (PID: {pid})")
-                            
-                            # Wait up to 5 seconds for force termination to complete
-                            terminated = False
-                            for _ in range(50):  # 5 seconds at 0.1s intervals
-                                if not self._is_process_running(pid):
-                                    terminated = True
-                                    break
-                                time.sleep(0.1)
-                            
-                            if terminated:
-                                print(f"Process {name} (PID: {pid}) and its group terminated after force kill")
-                                # Reap zombie processes to prevent accumulation
-                                self._reap_zombie_if_child(pid)
-                            else:
-                                print(f"Failed to kill process {name} (PID: {pid}) and its group")
-                                success = False
-                        except (OSError, ProcessLookupError):
-                            # Process already dead - this is success
-                            print(f"Process {name} (PID: {pid}) already terminated")
-                            # Reap zombie processes to prevent accumulation
-                            self._reap_zombie_if_child(pid)
+                    terminating.append((name, pid, pgid))
                 except (OSError, ProcessLookupError):
                     # Process already dead or no permission
                     print(f"Process {name} (PID: {pid}) already dead or no permission")
-                    pass
+        
+        # Wait for graceful termination
+        for _ in range(100):  # 10 seconds at 0.1s intervals
+            still_running = []
+            for name, pid, pgid in terminating:
+                if self._is_process_running(pid):
+                    still_running.append((name, pid, pgid))
+                else:
+                    print(f"Process {name} (PID: {pid}) and its group terminated gracefully")
+                    # Reap zombie processes to prevent accumulation
+                    self._reap_zombie_if_child(pid)
+            terminating = still_running
+            if not terminating:
+                break
+            time.sleep(0.1)
+        
+        # Force kill whatever is still running
+        killed = []
+        for name, pid, pgid in terminating:
+            try:
+                try:
+                    os.kill(-pgid, signal.SIGKILL)  # Use negative PID to target process group
+                    print(f"Sent SIGKILL to process group {pgid} for process {name} (PID: {pid})")
+                except (OSError, ProcessLookupError):
+                    # Fallback to individual process if process group fails
+                    os.kill(pid, signal.SIGKILL)
+                    print(f"Sent SIGKILL to process {name} (PID: {pid})")
+                killed.append((name, pid))
+            except (OSError, ProcessLookupError):
+                # Process already dead - this is success
+                print(f"Process {name} (PID: {pid}) already terminated")
+                # Reap zombie processes to prevent accumulation
+                self._reap_zombie_if_child(pid)
+        
+        # Wait up to 5 seconds for force termination to complete
+        for _ in range(50):  # 5 seconds at 0.1s intervals
+            if not killed:
+                break
+            still_running = []
+            for name, pid in killed:
+                if self._is_process_running(pid):
+                    still_running.append((name, pid))
+                else:
+                    print(f"Process {name} (PID: {pid}) and its group terminated after force kill")
+                    # Reap zombie processes to prevent accumulation
+                    self._reap_zombie_if_child(pid)
+            killed = still_running
+            if killed:
+                time.sleep(0.1)
+        
+        for name, pid in killed:
+            print(f"Failed to kill process {name} (PID: {pid}) and its group")
+            success = False
         
         # Clear the PID file after cleanup
         self._save_pids({})
@@ -377,23 +427,16 @@ class ProcessManager:
                 with open(self.pid_file, 'r') as f:
                     pids = json.load(f)
                 
-                # Clean up stale PIDs and get fresh data
-                self._cleanup_stale_pids(pids)
-                
-                # Reload the cleaned up data
-                with open(self.pid_file, 'r') as f:
-                    pids = json.load(f)
+                # Clean up stale PIDs; every surviving entry was just probed as running
+                pids = self._cleanup_stale_pids(pids)
                     
                 for name, proc_info in pids.items():
                     # Handle both old format (just PID) and new format (dict with pid/pgid)
                     if isinstance(proc_info, dict):
-                        pid = proc_info.get('pid')
+                        running[name] = proc_info.get('pid')
                     else:
                         # Old format - just PID
-                        pid = proc_info
-                    
-                    if pid and self._is_process_running(pid):
-                        running[name] = pid
+                        running[name] = proc_info
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
         return running
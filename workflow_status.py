@@ -7,10 +7,72 @@ Provides consistent workflow state reading and parsing for both CLI and web UI
 import os
 import re
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 
+# Files modified more recently than this may still be rewritten within the same
+# timestamp tick (second-granularity filesystems, 2s on FAT), so they are not cached
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class FileContentCache:
+    """Bounded LRU of text file contents, reused while a file's stat is unchanged
+    
+    Only contents read well after the file's last modification are kept: any later
+    write then lands on a newer mtime, so a same-size rewrite in the same timestamp
+    tick can never be mistaken for the cached version.
+    """
+    
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def read(self, file_path, encoding: str = 'utf-8') -> str:
+        """Return the file's contents; raises like open() does"""
+        stat = os.stat(file_path)
+        key = (str(file_path), encoding)
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                return cached[1]
+        
+        with open(file_path, 'r', encoding=encoding) as f:
+            content = f.read()
+        
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = (signature, content)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return content
+
+
+# Recently read status, checklist and output files
+_file_cache = FileContentCache()
+
+# Checkbox mark of every "- [ ]" / "- [x]" task line in a checklist
+_TASK_MARK_RE = re.compile(r'^[ \t]*-[ \t]*\[([x ])\]', re.MULTILINE)
+
+# Line prefixes stripped when extracting the current task, compiled once
+_OPEN_TASK_RE = re.compile(r'^\s*-\s*\[\s\]\s*')
+_CURRENT_TASK_PREFIX_RE = re.compile(r'^(\*\*)?Current task:(\*\*)?\s*')
+_LIST_PREFIX_RE = re.compile(r'^(?:\d+\.\s*)?(?:[-*]\s*)?')
+
+# Mode-specific directory names under the project root
+_OUTPUTS_DIR_NAMES = {'meta': '.agent-outputs-meta', 'regular': '.agent-outputs'}
+_CLAUDE_DIR_NAMES = {'meta': '.claude-meta', 'regular': '.claude'}
+
+# StatusReader instances keyed by project root; readers hold no per-call state
+_reader_cache = {}
+
+
 class StatusReader:
     """Reads and parses workflow status from orchestrator files"""
     
@@ -23,8 +85,12 @@ class StatusReader:
         }
         # Use provided project_root or fall back to current working directory
         self.project_root = project_root if project_root is not None else Path(os.getcwd())
-        # File lock for thread-safe operations  
-        self._file_lock = threading.RLock()
+        # Detected mode, remembered until invalidate() is called
+        self._mode = None
+        # Per-mode directories, built once instead of joined on every lookup
+        self._outputs_dirs = {mode: self.project_root / name for mode, name in _OUTPUTS_DIR_NAMES.items()}
+        self._claude_dirs = {mode: self.project_root / name for mode, name in _CLAUDE_DIR_NAMES.items()}
+        self._meta_marker = str(self._outputs_dirs['meta'])
 
     def __del__(self):
         """Clean up resources on destruction"""
@@ -32,30 +98,35 @@ class StatusReader:
 
     def _get_current_mode(self) -> str:
         """Detect current mode by checking for .agent-outputs-meta directory existence"""
-        meta_dir = self.project_root / '.agent-outputs-meta'
-        return 'meta' if meta_dir.exists() else 'regular'
+        if self._mode is None:
+            self._mode = 'meta' if os.path.isdir(self._meta_marker) else 'regular'
+        return self._mode
+
+    def invalidate(self):
+        """Forget the detected mode so the next lookup re-checks the filesystem"""
+        self._mode = None
 
     def _get_outputs_dir(self, mode: str = None) -> Path:
         """Get appropriate outputs directory based on mode"""
         if mode is None:
             mode = self._get_current_mode()
-        return self.project_root / ('.agent-outputs-meta' if mode == 'meta' else '.agent-outputs')
+        return self._outputs_dirs['meta' if mode == 'meta' else 'regular']
 
     def _get_claude_dir(self, mode: str = None) -> Path:
         """Get appropriate claude directory based on mode"""
         if mode is None:
             mode = self._get_current_mode()
-        return self.project_root / ('.claude-meta' if mode == 'meta' else '.claude')
+        return self._claude_dirs['meta' if mode == 'meta' else 'regular']
 
     def _read_file_safely(self, file_path: Path, encoding='utf-8') -> str:
         """Thread-safe file reading with proper error handling"""
         # Use direct file read instead of ThreadPoolExecutor to avoid deadlocks
         # when multiple API servers are competing for resources
         try:
-            if not file_path.exists():
-                return None
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            return _file_cache.read(file_path, encoding)
+        except FileNotFoundError:
+            # Missing files are expected (e.g. before the first agent runs)
+            return None
         except Exception as e:
             print(f"[StatusReader] Error reading file {file_path}: {e}")
             return None
@@ -111,6 +182,9 @@ class StatusReader:
         workflow = []
         agents = []
         
+        # Pending user validation affects both the Criteria Gate and the extra gate item below
+        has_user_validation_gate = self._has_user_validation_gate(mode)
+        
         for line in lines:
             line = line.strip()
             if not line or line.startswith('#'):
@@ -143,7 +217,7 @@ class StatusReader:
                     
                     # Special logic for Criteria Gate: if User Validation Gate exists or all agents are complete, Criteria Gate should not be active
                     if agent_name == "Criteria Gate" and status == 'in-progress':
-                        if self._has_user_validation_gate(mode):
+                        if has_user_validation_gate:
                             # User Validation supersedes Criteria Gate activity
                             status = 'completed'
                         else:
@@ -188,7 +262,7 @@ class StatusReader:
                     break
         
         # Add User Validation Gate as separate item if it exists
-        if self._has_user_validation_gate(mode):
+        if has_user_validation_gate:
             user_validation_item = {
                 'name': 'User Validation Gate',
                 'status': 'in-progress',
@@ -230,29 +304,31 @@ class StatusReader:
         if mode is None:
             mode = self._get_current_mode()
         outputs_dir = self._get_outputs_dir(mode)
-        validation_file = outputs_dir / 'pending-user_validation-gate.md'
-        return validation_file.exists()
+        return os.path.isfile(os.path.join(outputs_dir, 'pending-user_validation-gate.md'))
     
     def has_pending_gate(self, gate_type: str, mode: str = None) -> bool:
         """Check if a specific pending gate file exists"""
         if mode is None:
             mode = self._get_current_mode()
         outputs_dir = self._get_outputs_dir(mode)
-        pending_gate_file = outputs_dir / f'pending-{gate_type}-gate.md'
-        return pending_gate_file.exists()
+        return os.path.isfile(os.path.join(outputs_dir, f'pending-{gate_type}-gate.md'))
     
     def get_pending_gates(self, mode: str = None) -> List[str]:
         """Get list of all pending gate types"""
         if mode is None:
             mode = self._get_current_mode()
         gate_types = ['criteria', 'completion', 'user_validation']
-        pending_gates = []
         
-        for gate_type in gate_types:
-            if self.has_pending_gate(gate_type, mode):
-                pending_gates.append(gate_type)
+        # List the outputs directory once and check every gate against that listing
+        try:
+            with os.scandir(self._get_outputs_dir(mode)) as entries:
+                gate_files = {entry.name for entry in entries
+                              if entry.name.startswith('pending-') and entry.is_file()}
+        except OSError:
+            return []
         
-        return pending_gates
+        return [gate_type for gate_type in gate_types
+                if f'pending-{gate_type}-gate.md' in gate_files]
     
     def _is_workflow_complete(self, mode=None):
         """Check if workflow has been completed (completion approved or all checklist tasks done)"""        
@@ -263,40 +339,33 @@ class StatusReader:
         claude_dir = self._get_claude_dir(mode)
         
         # Check for standard completion approval
-        completion_file = outputs_dir / 'completion-approved.md'
-        if completion_file.exists():
+        if os.path.exists(os.path.join(outputs_dir, 'completion-approved.md')):
             return True
         
-        # Check if all checklist tasks are complete
+        # Check if all checklist tasks are complete; a missing file reads as None,
+        # so no separate existence probe is needed
         checklist_file = claude_dir / 'tasks-checklist.md'
-        print(f"[DEBUG] StatusReader project_root: {self.project_root.absolute()}")
-        print(f"[DEBUG] Checking checklist file: {checklist_file.absolute()}")
-        print(f"[DEBUG] File exists: {checklist_file.exists()}")
-        if checklist_file.exists():
-            content = self._read_file_safely(checklist_file)
-            if content is None:
-                return False
-            lines = content.split('\n')
-            
-            # Find all task lines
-            has_tasks = False
-            all_complete = True
-            
-            print(f"[DEBUG] Checking checklist completion: {checklist_file}")
-            for line in lines:
-                # Look for task lines: - [ ] or - [x]
-                if re.match(r'^\s*-\s*\[[x ]\]', line):
-                    has_tasks = True
-                    print(f"[DEBUG] Found task: {line.strip()[:60]}...")
-                    if not re.match(r'^\s*-\s*\[x\]', line):
-                        all_complete = False
-                        print(f"[DEBUG] Task not complete")
-                        break
+        content = self._read_file_safely(checklist_file)
+        # Resolving absolute paths costs a getcwd per call, so only do it when debugging
+        debug_mode = os.getenv('CLAUDE_ORCHESTRATOR_DEBUG', '').lower() in ('1', 'true', 'yes')
+        if debug_mode:
+            print(f"[DEBUG] StatusReader project_root: {self.project_root.absolute()}")
+            print(f"[DEBUG] Checking checklist file: {checklist_file.absolute()}")
+            print(f"[DEBUG] File exists: {content is not None}")
+        if content is not None:
+            # Collect the checkbox marks of all task lines in one pass
+            if debug_mode:
+                print(f"[DEBUG] Checking checklist completion: {checklist_file}")
+            task_marks = _TASK_MARK_RE.findall(content)
+            has_tasks = bool(task_marks)
+            all_complete = ' ' not in task_marks
             
-            print(f"[DEBUG] has_tasks: {has_tasks}, all_complete: {all_complete}")
+            if debug_mode:
+                print(f"[DEBUG] has_tasks: {has_tasks}, all_complete: {all_complete}")
             # If we have tasks and they're all complete, workflow is done
             if has_tasks and all_complete:
-                print(f"[DEBUG] Workflow complete via checklist!")
+                if debug_mode:
+                    print(f"[DEBUG] Workflow complete via checklist!")
                 return True
         
         return False
@@ -307,15 +376,22 @@ class StatusReader:
             mode = self._get_current_mode()
         outputs_dir = self._get_outputs_dir(mode)
         
+        # One directory read instead of a stat per file
+        try:
+            with os.scandir(outputs_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        
         return {
-            "exploration.md": (outputs_dir / "exploration.md").exists(),
-            "success-criteria.md": (outputs_dir / "success-criteria.md").exists(),
-            "plan.md": (outputs_dir / "plan.md").exists(),
-            "changes.md": (outputs_dir / "changes.md").exists(),
-            "orchestrator-log.md": (outputs_dir / "orchestrator-log.md").exists(),
-            "verification.md": (outputs_dir / "verification.md").exists(),
-            "scribe.md": (outputs_dir / "scribe.md").exists() or (outputs_dir / "scribe-fallback.md").exists(),
-            "completion-approved.md": (outputs_dir / "completion-approved.md").exists()
+            "exploration.md": "exploration.md" in present,
+            "success-criteria.md": "success-criteria.md" in present,
+            "plan.md": "plan.md" in present,
+            "changes.md": "changes.md" in present,
+            "orchestrator-log.md": "orchestrator-log.md" in present,
+            "verification.md": "verification.md" in present,
+            "scribe.md": "scribe.md" in present or "scribe-fallback.md" in present,
+            "completion-approved.md": "completion-approved.md" in present
         }
     
     def _get_agent_icon(self, agent_name):
@@ -357,20 +433,18 @@ class StatusReader:
         claude_dir = self._get_claude_dir(mode)
         checklist_file = claude_dir / 'task-checklist.md'  # Fixed: removed 's' from tasks
         
-        if not checklist_file.exists():
-            # If checklist doesn't exist, check for alternative task sources
-            return self._get_current_task_from_alternatives(mode)
-        
         content = self._read_file_safely(checklist_file)
         if content is None:
+            # If checklist doesn't exist, check for alternative task sources
             return self._get_current_task_from_alternatives(mode)
         
         lines = content.split('\n')
         for line in lines:
             # Look for incomplete task lines: - [ ]
-            if re.match(r'^\s*-\s*\[\s\]', line):
+            open_task = _OPEN_TASK_RE.match(line)
+            if open_task:
                 # Extract task text and clean it up
-                task_text = re.sub(r'^\s*-\s*\[\s\]\s*', '', line).strip()
+                task_text = line[open_task.end():].strip()
                 if task_text:
                     # Return full text without truncation
                     return task_text
@@ -385,17 +459,17 @@ class StatusReader:
         outputs_dir = self._get_outputs_dir(mode)
         status_file = outputs_dir / 'current-status.md'
         
-        if status_file.exists():
-            content = self._read_file_safely(status_file)
-            if content:
-                lines = content.strip().split('\n')
-                # Look for explicit current task lines
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('Current task:') or line.startswith('**Current task:**'):
-                        task_text = re.sub(r'^(\*\*)?Current task:(\*\*)?\s*', '', line).strip()
-                        if task_text and len(task_text) > 3:  # Avoid very short/empty tasks
-                            return task_text
+        # _read_file_safely returns None for missing files, so no exists() probe first
+        content = self._read_file_safely(status_file)
+        if content:
+            lines = content.strip().split('\n')
+            # Look for explicit current task lines
+            for line in lines:
+                line = line.strip()
+                if line.startswith('Current task:') or line.startswith('**Current task:**'):
+                    task_text = _CURRENT_TASK_PREFIX_RE.sub('', line).strip()
+                    if task_text and len(task_text) > 3:  # Avoid very short/empty tasks
+                        return task_text
         
         # Check for active tasks in output files
         task_sources = [
@@ -407,27 +481,26 @@ class StatusReader:
         
         for filename, default_task in task_sources:
             file_path = outputs_dir / filename
-            if file_path.exists():
-                content = self._read_file_safely(file_path)
-                if content and len(content.strip()) > 10:  # File has substantial content
-                    # Try to extract a meaningful task description from the file
-                    lines = content.strip().split('\n')[:10]  # Check first 10 lines
-                    for line in lines:
-                        line = line.strip()
-                        # Look for task-like lines (not just headers or metadata)
-                        if (line and not line.startswith('#') and not line.startswith('**') 
-                            and len(line) > 20 and not line.startswith('---')):
-                            # Clean up and use this line as task
-                            clean_line = re.sub(r'^\d+\.\s*', '', line)  # Remove numbered list prefix
-                            clean_line = re.sub(r'^[-*]\s*', '', clean_line)  # Remove bullet points
-                            if len(clean_line) > 15:  # Ensure it's substantial
-                                return clean_line
-                    
-                    # If no good line found, use the default task for this phase
-                    return default_task
+            content = self._read_file_safely(file_path)
+            if content and len(content.strip()) > 10:  # File has substantial content
+                # Try to extract a meaningful task description from the file
+                lines = content.strip().split('\n')[:10]  # Check first 10 lines
+                for line in lines:
+                    line = line.strip()
+                    # Look for task-like lines (not just headers or metadata)
+                    if (line and not line.startswith('#') and not line.startswith('**') 
+                        and len(line) > 20 and not line.startswith('---')):
+                        # Clean up and use this line as task
+                        clean_line = _LIST_PREFIX_RE.sub('', line, count=1)  # Remove numbered list prefix and bullet
+                        if len(clean_line) > 15:  # Ensure it's substantial
+                            return clean_line
+                
+                # If no good line found, use the default task for this phase
+                return default_task
         
         # Final fallback - check if we're in a workflow state by examining any .agent-outputs files
-        if any(f.exists() for f in outputs_dir.glob('*.md') if f.name != 'current-status.md'):
+        # glob only yields existing entries, so stop at the first match without re-stat'ing it
+        if any(f.name != 'current-status.md' for f in outputs_dir.glob('*.md')):
             return f"Workflow in progress ({mode} mode)"
         
         return 'No active task'
@@ -461,6 +534,16 @@ class StatusReader:
         }
 
 
+def get_status_reader(project_root: Path = None) -> StatusReader:
+    """Shared StatusReader for a project root (defaults to the current working directory)"""
+    if project_root is None:
+        project_root = Path(os.getcwd())
+    reader = _reader_cache.get(project_root)
+    if reader is None:
+        reader = _reader_cache[project_root] = StatusReader(project_root)
+    return reader
+
+
 def get_workflow_status(project_root: Path = None, mode: str = None) -> Dict[str, Any]:
     """
     Unified function to get workflow status - used by both orchestrate.py and api_server.py
@@ -472,8 +555,12 @@ def get_workflow_status(project_root: Path = None, mode: str = None) -> Dict[str
     Returns:
         Dict containing currentTask, workflow, agents, workflowComplete, and additional state info
     """
-    reader = StatusReader(project_root)
+    if project_root is None:
+        project_root = Path(os.getcwd())
+    reader = get_status_reader(project_root)
     if mode is None:
+        # Shared readers outlive mode switches, so detect afresh for each request
+        reader.invalidate()
         mode = reader._get_current_mode()
     status = reader.read_status(mode)
     